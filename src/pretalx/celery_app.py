@@ -1,11 +1,21 @@
 import os
 
-from celery import Celery
+from celery import Celery, Task
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pretalx.settings")
 
 from django.conf import settings  # noqa
 
-app = Celery('pretalx')
+
+class LogBufferTask(Task):
+    """ Writes all log entries of a task with one query, see ``log_buffer``. """
+
+    def __call__(self, *args, **kwargs):
+        from pretalx.common.mixins import log_buffer
+        with log_buffer():
+            return super().__call__(*args, **kwargs)
+
+
+app = Celery('pretalx', task_cls=LogBufferTask)
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
@@ -4,7 +4,7 @@ from django import forms
 
 from pretalx import settings
 from pretalx.submission.models import (
-    QuestionVariant, Submission, SubmissionType,
+    Answer, QuestionVariant, Submission, SubmissionType,
 )
 
 
@@ -30,6 +30,28 @@ class InfoForm(forms.ModelForm):
         ]
 
 
+class OptionChoiceField(forms.ChoiceField):
+    """ Chooses one of the given answer options without querying for them. """
+
+    def __init__(self, options, **kwargs):
+        self.options = {str(option.pk): option for option in options}
+        super().__init__(choices=[(option.pk, str(option)) for option in options], **kwargs)
+
+    def clean(self, value):
+        return self.options.get(super().clean(value))
+
+
+class OptionMultipleChoiceField(forms.MultipleChoiceField):
+    """ Chooses any of the given answer options without querying for them. """
+
+    def __init__(self, options, **kwargs):
+        self.options = {str(option.pk): option for option in options}
+        super().__init__(choices=[(option.pk, str(option)) for option in options], **kwargs)
+
+    def clean(self, value):
+        return [self.options[pk] for pk in super().clean(value)]
+
+
 class QuestionsForm(forms.Form):
     def __init__(self, *args, **kwargs):
         event = kwargs.pop('event', None)
@@ -38,18 +60,16 @@ class QuestionsForm(forms.Form):
 
         super().__init__(*args, **kwargs)
 
-        for q in event.questions.prefetch_related('options'):
-            if submission:
-                answers = [a for a in submission.answers.all() if a.question_id == q.id]
-                if answers:
-                    initial_obj = answers[0]
-                    initial = answers[0].answer
-                else:
-                    initial_obj = None
-                    initial = q.default_answer
-            else:
-                initial_obj = None
-                initial = q.default_answer
+        answers = {
+            answer.question_id: answer for answer in submission.answers.prefetch_related('options')
+        } if submission else {}
+        for q in event.question_schema:
+            initial_obj = answers.get(q.id)
+            initial = initial_obj.answer if initial_obj else q.default_answer
+            options = list(q.options.all())
+            chosen = []
+            if initial_obj and q.variant in (QuestionVariant.CHOICES, QuestionVariant.MULTIPLE):
+                chosen = [option.pk for option in initial_obj.options.all()]
 
             if q.variant == QuestionVariant.BOOLEAN:
                 # For some reason, django-bootstrap4 does not set the required attribute
@@ -81,21 +101,56 @@ class QuestionsForm(forms.Form):
                     initial=initial
                 )
             elif q.variant == QuestionVariant.CHOICES:
-                field = forms.ModelChoiceField(
-                    queryset=q.options.all(),
+                field = OptionChoiceField(
+                    options=options,
                     label=q.question, required=q.required,
                     widget=forms.RadioSelect,
-                    initial=initial_obj.options.first() if initial_obj else q.default_answer,
+                    initial=chosen[0] if chosen else q.default_answer,
                     disabled=readonly,
                 )
             elif q.variant == QuestionVariant.MULTIPLE:
-                field = forms.ModelMultipleChoiceField(
-                    queryset=q.options.all(),
+                field = OptionMultipleChoiceField(
+                    options=options,
                     label=q.question, required=q.required,
                     widget=forms.CheckboxSelectMultiple,
-                    initial=initial_obj.options.all() if initial_obj else q.default_answer,
+                    initial=chosen if initial_obj else q.default_answer,
                     disabled=readonly,
                 )
             field.question = q
             field.answer = initial_obj
             self.fields['question_%s' % q.id] = field
+
+    def save_answers(self, submission) -> list:
+        """
+        Creates the answers of a new submission with one INSERT for all
+        answers and one for all their chosen options, using the questions
+        already loaded for the form fields.
+        """
+        answers, options = [], []
+        for name, value in self.cleaned_data.items():
+            question = self.fields[name].question
+            if question.variant == QuestionVariant.MULTIPLE:
+                chosen = list(value)
+                text = ', '.join(str(option) for option in chosen)
+            elif question.variant == QuestionVariant.CHOICES:
+                chosen = [value] if value else []
+                text = value.answer if value else ''
+            else:
+                chosen = []
+                text = value if value is not None else ''
+            answers.append(Answer(question=question, submission=submission, answer=text))
+            options.append(chosen)
+
+        Answer.objects.bulk_create(answers)
+        Answer.update_counters(answers, 1)
+        if answers and answers[0].pk is None:
+            # Not every database backend returns the primary keys of bulk inserts
+            pks = dict(submission.answers.values_list('question_id', 'pk'))
+            for answer in answers:
+                answer.pk = pks[answer.question_id]
+        Answer.options.through.objects.bulk_create([
+            Answer.options.through(answer_id=answer.pk, answeroption_id=option.pk)
+            for answer, chosen in zip(answers, options)
+            for option in chosen
+        ])
+        return answers
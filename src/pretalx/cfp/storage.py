@@ -0,0 +1,43 @@
+import hashlib
+
+from django.core.cache import cache
+from formtools.wizard.storage.base import BaseStorage
+
+WIZARD_CACHE_TIMEOUT = 24 * 3600
+# Posted along with every step, but never needed to restore a form
+IGNORED_STEP_DATA = ('csrfmiddlewaretoken',)
+
+
+class CacheStorage(BaseStorage):
+    """
+    Keeps the wizard state in the shared cache instead of the session, keyed
+    by the wizard prefix, which contains the random ``tmpid`` from the URL.
+    Wizard steps thus do not write to the session table at all.
+
+    The prefix is hashed, as the URL accepts any ``tmpid``, and memcached
+    rejects keys that are long or contain spaces or control characters.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.data = cache.get(self.cache_key)
+        if self.data is None:
+            self.init_data()
+
+    @property
+    def cache_key(self) -> str:
+        return 'pretalx:cfp:wizard:' + hashlib.sha256(self.prefix.encode()).hexdigest()
+
+    def set_step_data(self, step, cleaned_data):
+        super().set_step_data(step, cleaned_data)
+        step_data = self.data[self.step_data_key][step]
+        for key in list(step_data):
+            if key in IGNORED_STEP_DATA or key.endswith('-current_step'):
+                del step_data[key]
+
+    def update_response(self, response):
+        super().update_response(response)
+        if self.data[self.step_key] is None and not self.data[self.step_data_key]:
+            cache.delete(self.cache_key)
+        else:
+            cache.set(self.cache_key, self.data, WIZARD_CACHE_TIMEOUT)
@@ -1,6 +1,6 @@
 from django.conf.urls import url
 
-from .views import auth, event, locale, user, wizard
+from .views import auth, event, locale, schedule, user, wizard
 
 cfp_urls = [
     url('^(?P<event>\w+)/$', event.EventStartpage.as_view(), name='event.start'),
@@ -25,6 +25,9 @@ cfp_urls = [
     url('^(?P<event>\w+)/me/submissions/(?P<id>\d+)/confirm$', user.SubmissionConfirmView.as_view(),
         name='event.user.submission.confirm'),
 
+    url('^(?P<event>\w+)/schedule/(?P<version>.+)/export\.(?P<format>json|xml|ics)$',
+        schedule.ScheduleExportView.as_view(), name='event.schedule.export'),
+
     url('^locale/set', locale.LocaleSet.as_view(),
         name='locale.set'),
 ]
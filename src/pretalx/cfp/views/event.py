@@ -9,8 +9,7 @@ from django.utils.translation.trans_real import (
 )
 from django.views.generic import TemplateView
 
-from pretalx.event.models import Event
-from pretalx.person.models import EventPermission
+from pretalx.event.cache import get_event, is_orga
 
 
 class EventPageMixin:
@@ -18,18 +17,16 @@ class EventPageMixin:
         event_slug = kwargs.get('event')
 
         if event_slug:
-            try:
-                request.event = Event.objects.get(slug=event_slug)
-            except Event.DoesNotExist:
+            # EventPermissionMiddleware has usually resolved the event already
+            if getattr(request, 'event', None) is None:
+                request.event = get_event(event_slug)
+            if request.event is None:
                 raise Http404()
 
             if not request.event.is_public:
-                is_permitted = request.user.is_authenticated and EventPermission.objects.filter(
-                    user=request.user,
-                    event=request.event,
-                    is_orga=True,
-                ).exists()
-                if not is_permitted:
+                if not hasattr(request, 'is_orga'):
+                    request.is_orga = is_orga(request.user, request.event)
+                if not request.is_orga:
                     raise Http404()
 
             self._select_locale(request)
@@ -0,0 +1,37 @@
+import logging
+
+from django.http import FileResponse, Http404
+from django.views.generic import View
+
+from pretalx.cfp.views.event import EventPageMixin
+from pretalx.schedule.exporters import EXPORTERS
+from pretalx.schedule.models import Schedule
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleExportView(EventPageMixin, View):
+    """
+    Serves the files rendered when a schedule version was released. As a
+    released version never changes, clients may cache them indefinitely,
+    and shared caches may, too, if the event is public.
+    """
+
+    def get(self, request, event, version, format):
+        try:
+            schedule = request.event.schedules.get(version=version)
+        except Schedule.DoesNotExist:
+            raise Http404()
+
+        exporter = EXPORTERS[format](schedule)
+        try:
+            content = exporter.open()
+        except Exception:
+            logger.exception('Could not export schedule %s as %s', schedule.pk, format)
+            raise Http404()
+        response = FileResponse(content, content_type=exporter.content_type)
+        if request.event.is_public:
+            response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response['Cache-Control'] = 'private'
+        return response
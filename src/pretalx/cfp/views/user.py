@@ -1,4 +1,3 @@
-from django import forms
 from django.contrib import messages
 from django.http import Http404
 from django.shortcuts import redirect
@@ -11,7 +10,9 @@ from django.views.generic import (
 from pretalx.cfp.forms.submissions import InfoForm, QuestionsForm
 from pretalx.cfp.views.event import LoggedInEventPageMixin
 from pretalx.person.forms import LoginInfoForm, SpeakerProfileForm
-from pretalx.submission.models import Answer, Submission, SubmissionStates
+from pretalx.submission.models import (
+    Answer, QuestionVariant, Submission, SubmissionStates,
+)
 
 
 class ProfileView(LoggedInEventPageMixin, TemplateView):
@@ -201,7 +202,7 @@ class SubmissionsEditView(LoggedInEventPageMixin, UpdateView):
 
     def _save_to_answer(self, field, answer, value):
         action = 'pretalx.submission.answer' + ('update' if answer.pk else 'create')
-        if isinstance(field, forms.ModelMultipleChoiceField):
+        if field.question.variant == QuestionVariant.MULTIPLE:
             answstr = ', '.join([str(o) for o in value])
             if not answer.pk:
                 answer.save()
@@ -209,7 +210,7 @@ class SubmissionsEditView(LoggedInEventPageMixin, UpdateView):
                 answer.options.clear()
             answer.answer = answstr
             answer.options.add(*value)
-        elif isinstance(field, forms.ModelChoiceField):
+        elif field.question.variant == QuestionVariant.CHOICES:
             if not answer.pk:
                 answer.save()
             else:
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import login
 from django.shortcuts import redirect
@@ -9,10 +10,11 @@ from formtools.wizard.views import NamedUrlSessionWizardView
 
 from pretalx.cfp.forms.submissions import InfoForm, QuestionsForm
 from pretalx.cfp.views.event import EventPageMixin
+from pretalx.event.models import EventCounter
+from pretalx.event.models.counter import submission_day_counter_name
 from pretalx.mail.context import template_context_from_submission
 from pretalx.person.forms import SpeakerProfileForm, UserForm
 from pretalx.person.models import User
-from pretalx.submission.models import Answer, Question, QuestionVariant
 
 FORMS = [
     ("info", InfoForm),
@@ -31,7 +33,8 @@ TEMPLATES = {
 
 class SubmitStartView(EventPageMixin, View):
     def get(self, request, *args, **kwargs):
-        newid = get_random_string(length=6)
+        # The id is all that protects the wizard state in the shared cache
+        newid = get_random_string(length=32)
         return redirect(reverse('cfp:event.submit', kwargs={
             'event': request.event.slug,
             'step': 'info',
@@ -40,7 +43,7 @@ class SubmitStartView(EventPageMixin, View):
 
 
 def show_questions_page(wizard):
-    return wizard.request.event.questions.exists()
+    return bool(wizard.request.event.question_schema)
 
 
 def show_user_page(wizard):
@@ -49,6 +52,10 @@ def show_user_page(wizard):
 
 class SubmitWizard(EventPageMixin, NamedUrlSessionWizardView):
     form_list = FORMS
+    storage_name = (
+        'pretalx.cfp.storage.CacheStorage' if settings.REAL_CACHE_USED
+        else 'formtools.wizard.storage.session.SessionStorage'
+    )
     condition_dict = {
         'questions': show_questions_page,
         'user': show_user_page
@@ -114,25 +121,13 @@ class SubmitWizard(EventPageMixin, NamedUrlSessionWizardView):
         )
 
         if 'questions' in form_dict:
-            for k, value in form_dict['questions'].cleaned_data.items():
-                qid = k.split('_')[1]
-                question = Question.objects.get(pk=qid)
-                answer = Answer(question=question, submission=sub)
-
-                if question.variant == QuestionVariant.MULTIPLE:
-                    answstr = ", ".join([str(o) for o in value])
-                    answer.save()
-                    answer.answer = answstr
-                    answer.options.add(*value)
-                elif question.variant == QuestionVariant.CHOICES:
-                    answer.save()
-                    answer.options.add(value)
-                    answer.answer = value.answer
-                else:
-                    answer.answer = value
-                answer.save()
+            form_dict['questions'].save_answers(sub)
 
         sub.log_action('pretalx.submission.create', person=user)
+        counters = {submission_day_counter_name(): 1}
+        if not user.submissions.filter(event=self.request.event).exclude(pk=sub.pk).exists():
+            counters['speakers'] = 1
+        EventCounter.change(self.request.event.pk, counters)
         messages.success(self.request, 'Your talk has been submitted successfully!')
         login(self.request, user)
         return redirect(reverse('cfp:event.user.submissions', kwargs={
@@ -1,13 +1,17 @@
 import logging
+import time
 from smtplib import SMTPRecipientsRefused, SMTPSenderRefused
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
+from django.conf import settings
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.mail.backends.smtp import EmailBackend
+from django.db import transaction
 from django.utils.translation import override
 from i18nfield.strings import LazyI18nString
 
 from pretalx.celery_app import app
+from pretalx.common.mixins import log_buffer
 from pretalx.event.models import Event
 from pretalx.person.models import User
 
@@ -76,3 +80,87 @@ def mail_send_task(to: str, subject: str, body: str, sender: str,
     except Exception:
         logger.exception('Error sending email')
         raise SendMailException('Failed to send an email to {}.'.format(to))
+
+
+@app.task
+def send_queued_mails_task(mails: List[int], chunk_size: int=None, person: int=None):
+    """
+    Sends the given QueuedMails, reusing one connection per event and chunk
+    of ``chunk_size`` mails, and pausing between chunks to stay below
+    settings.MAIL_RATE_LIMIT mails per second. Sent mails are logged as sent
+    by ``person`` and removed from the outbox after each chunk; failed mails
+    stay there with their error message.
+    """
+    from pretalx.mail.models import QueuedMail
+
+    chunk_size = chunk_size or settings.MAIL_BATCH_SIZE
+    person = User.objects.filter(pk=person).first() if person else None
+    queryset = QueuedMail.objects.filter(pk__in=mails).select_related('event').order_by('event_id', 'pk')
+    mails_by_event = {}
+    for mail in queryset:
+        mails_by_event.setdefault(mail.event, []).append(mail)
+
+    sent = 0
+    for event, event_mails in mails_by_event.items():
+        backend = event.get_mail_backend()
+        for start in range(0, len(event_mails), chunk_size):
+            if start and settings.MAIL_RATE_LIMIT:
+                time.sleep(chunk_size / settings.MAIL_RATE_LIMIT)
+            sent += _send_mail_chunk(backend, event, event_mails[start:start + chunk_size], person)
+    return sent
+
+
+def _error_message(exception: Exception) -> str:
+    return str(exception) or exception.__class__.__name__
+
+
+def _open_connection(backend, reopen: bool=False) -> str:
+    """ Opens the backend's connection, and returns the error if that fails. """
+    try:
+        if reopen:
+            backend.close()
+        backend.open()
+    except Exception as e:
+        logger.exception('Error connecting to the mail server')
+        return _error_message(e)
+
+
+def _send_mail_chunk(backend, event, mails: list, person=None) -> int:
+    """
+    Sends the mails over one connection and records the outcome right away,
+    even if the connection fails, so that no mail is sent twice.
+    """
+    sent, failed = [], {}
+    try:
+        error = _open_connection(backend)
+        for index, mail in enumerate(mails):
+            if error:
+                failed.update({mail.pk: error for mail in mails[index:]})
+                break
+            email = EmailMultiAlternatives(mail.subject, mail.text, mail.reply_to, to=[mail.to])
+            try:
+                backend.send_messages([email])
+            except Exception as e:
+                logger.exception('Error sending email')
+                failed[mail.pk] = _error_message(e)
+                # The connection may be unusable after an error
+                error = _open_connection(backend, reopen=True)
+            else:
+                sent.append(mail)
+    finally:
+        _record_mail_chunk(event, sent, failed, person)
+        backend.close()
+    return len(sent)
+
+
+def _record_mail_chunk(event, sent: list, failed: dict, person=None) -> None:
+    from pretalx.event.models import EventCounter
+    from pretalx.mail.models import QueuedMail
+
+    with transaction.atomic(), log_buffer():
+        for mail in sent:
+            mail.log_action('pretalx.mail.sent', person=person, orga=True)
+        QueuedMail.objects.filter(pk__in=[mail.pk for mail in sent]).delete()
+        EventCounter.change(event.pk, {'pending_mails': -len(sent)})
+        for pk, error in failed.items():
+            QueuedMail.objects.filter(pk=pk).update(error=error)
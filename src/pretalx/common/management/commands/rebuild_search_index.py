@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from pretalx.common.models import SearchToken
+from pretalx.person.models import User
+from pretalx.submission.models import Submission
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search index for all submissions and users.'
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        SearchToken.objects.all().delete()
+        for queryset in (Submission.objects.select_related('event'), User.objects.all()):
+            count = 0
+            for obj in queryset.iterator():
+                obj.update_search_index()
+                count += 1
+            self.stdout.write(f'Indexed {count} {queryset.model._meta.verbose_name_plural}.')
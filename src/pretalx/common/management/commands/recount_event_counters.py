@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from pretalx.event.tasks import recount_event_counters
+
+
+class Command(BaseCommand):
+    help = 'Recounts the statistics of all events, for setups without celery beat.'
+
+    def handle(self, *args, **options):
+        recount_event_counters()
+        self.stdout.write('Recounted the statistics of all events.')
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import defaultdict
+
+from django.db import connections
+from django.db.backends.utils import CursorWrapper
+
+METRICS = (
+    ('requests', 'pretalx_requests_total', 'Number of handled requests.'),
+    ('queries', 'pretalx_request_queries_total', 'Number of database queries.'),
+    ('db_time', 'pretalx_request_db_seconds_total', 'Time spent in database queries.'),
+    ('template_time', 'pretalx_request_template_seconds_total', 'Time spent rendering templates.'),
+    ('total_time', 'pretalx_request_seconds_total', 'Time spent handling requests.'),
+)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class CountingCursorWrapper(CursorWrapper):
+
+    def __init__(self, cursor, db, counter):
+        super().__init__(cursor, db)
+        self.counter = counter
+
+    def execute(self, sql, params=None):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, params)
+        finally:
+            self.counter.add(time.perf_counter() - start)
+
+    def executemany(self, sql, param_list):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, param_list)
+        finally:
+            self.counter.add(time.perf_counter() - start)
+
+
+class QueryCounter:
+    """
+    Counts the queries run on a connection inside this block, and the time
+    spent in them. Unlike the debug cursor, this does not format and keep
+    the SQL of every query.
+    """
+
+    def __init__(self, connection):
+        self.connection = connections[connection.alias]
+        self.count = 0
+        self.time = 0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.time += duration
+
+    def __enter__(self):
+        self._previous = {}
+        for name in ('make_cursor', 'make_debug_cursor'):
+            self._previous[name] = vars(self.connection).get(name)
+            make_cursor = getattr(self.connection, name)
+            setattr(self.connection, name, self._wrap(make_cursor))
+        return self
+
+    def __exit__(self, *args):
+        for name, previous in self._previous.items():
+            if previous is None:
+                delattr(self.connection, name)
+            else:
+                setattr(self.connection, name, previous)
+
+    def _wrap(self, make_cursor):
+        return lambda cursor: CountingCursorWrapper(make_cursor(cursor), self.connection, self)
+
+
+class RequestMetrics:
+    """
+    Sums up request metrics per view name in this process. Every worker
+    process keeps and reports its own numbers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = defaultdict(lambda: defaultdict(float))
+
+    def record(self, view: str, **values) -> None:
+        with self._lock:
+            view_values = self._values[view]
+            view_values['requests'] += 1
+            for key, value in values.items():
+                view_values[key] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def get(self, view: str) -> dict:
+        with self._lock:
+            return dict(self._values.get(view, {}))
+
+    def render(self) -> str:
+        """ Returns all metrics in the Prometheus text exposition format. """
+        with self._lock:
+            values = {view: dict(view_values) for view, view_values in self._values.items()}
+        lines = []
+        for key, name, description in METRICS:
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} counter']
+            for view in sorted(values):
+                lines.append('{}{{view="{}"}} {}'.format(name, view.replace('"', '\\"'), values[view].get(key, 0)))
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
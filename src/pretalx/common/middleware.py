@@ -1,15 +1,26 @@
+import json
+import logging
+import time
+
 import pytz
 from django.conf import settings
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import MiddlewareNotUsed, PermissionDenied
+from django.db import connection
 from django.shortcuts import redirect
 from django.urls import resolve
 from django.utils import timezone, translation
+from django.utils.functional import SimpleLazyObject
 from django.utils.translation.trans_real import (
     get_supported_language_variant, language_code_re, parse_accept_lang_header,
 )
 
-from pretalx.event.models import Event
-from pretalx.person.models import EventPermission
+from pretalx.common.metrics import (
+    QueryBudgetExceeded, QueryCounter, request_metrics,
+)
+from pretalx.common.mixins import log_buffer
+from pretalx.event.cache import get_event, get_orga_events, is_orga
+
+logger = logging.getLogger('pretalx.metrics')
 
 
 class EventPermissionMiddleware:
@@ -26,26 +37,13 @@ class EventPermissionMiddleware:
 
         event_slug = url.kwargs.get('event')
         if event_slug:
-            try:
-                request.event = Event.objects.get(slug=event_slug)
-            except Event.DoesNotExist:
-                request.event = None
+            request.event = get_event(event_slug)
 
-            if hasattr(request, 'event') and not request.user.is_anonymous:
-                request.is_orga = request.user.is_superuser or EventPermission.objects.filter(
-                    user=request.user,
-                    event=request.event,
-                    is_orga=True
-                ).exists()
+            if not request.user.is_anonymous:
+                request.is_orga = is_orga(request.user, request.event)
 
         if not request.user.is_anonymous:
-            if request.user.is_superuser:
-                request.orga_events = Event.objects.all()
-            else:
-                request.orga_events = Event.objects.filter(
-                    permissions__user=request.user,
-                    permissions__is_orga=True,
-                )
+            request.orga_events = SimpleLazyObject(lambda: get_orga_events(request.user))
 
         if 'orga' in url.namespaces:
             if request.user.is_anonymous and url.url_name not in self.UNAUTHENTICATED:
@@ -114,3 +112,63 @@ class EventPermissionMiddleware:
                     return value
             except LookupError:
                 pass
+
+
+class LogBufferMiddleware:
+    """ Writes all log entries of a request with one query, see ``log_buffer``. """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with log_buffer():
+            return self.get_response(request)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures the number of queries, database time, template rendering time
+    and total time of every request, sums them up per view for the metrics
+    endpoint, and writes them to the pretalx.metrics log. Views listed in
+    settings.QUERY_BUDGETS must not run more queries than their budget.
+    Only active with settings.METRICS_ENABLED.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        request._template_time = 0
+        with QueryCounter(connection) as queries:
+            response = self.get_response(request)
+        total_time = time.perf_counter() - start
+
+        view = request.resolver_match.view_name if request.resolver_match else 'unresolved'
+        values = {
+            'queries': queries.count,
+            'db_time': queries.time,
+            'template_time': request._template_time,
+            'total_time': total_time,
+        }
+        request_metrics.record(view, **values)
+        logger.info(json.dumps(dict(view=view, status=response.status_code, **values)))
+
+        budget = settings.QUERY_BUDGETS.get(view)
+        if budget is not None and queries.count > budget:
+            message = f'{view} ran {queries.count} queries, its budget is {budget}.'
+            if settings.QUERY_BUDGETS_STRICT:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+
+        def measure(response):
+            request._template_time += time.perf_counter() - start
+
+        response.add_post_render_callback(measure)
+        return response
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def build_search_index(apps, schema_editor):
+    """
+    Indexes the existing submissions and users, which would otherwise only be
+    found after their next change. This uses the current models, as the
+    tokenizing logic lives on them, and only loads the indexed fields.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from pretalx.common.models import SearchToken
+    from pretalx.person.models import User
+    from pretalx.submission.models import Submission
+
+    for model, fields in ((Submission, ['event']), (User, [])):
+        content_type = ContentType.objects.get_for_model(model)
+        SearchToken.objects.filter(content_type=content_type).delete()
+        tokens = [
+            SearchToken(
+                content_type=content_type, object_id=obj.pk, event_id=getattr(obj, 'event_id', None),
+                token=token, weight=weight,
+            )
+            for obj in model.objects.only(*model.search_fields, *fields).iterator()
+            for token, weight in obj.get_search_tokens().items()
+        ]
+        SearchToken.objects.bulk_create(tokens, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0007_searchtoken_token_index'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('person', '0001_initial'),
+        ('submission', '0003_submission_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,46 @@
 import json
+import threading
+from contextlib import contextmanager
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+_log_buffers = threading.local()
+
+
+def _flush_log_entries(entries):
+    from pretalx.common.models import ActivityLog
+    if entries:
+        ActivityLog.objects.bulk_create(entries)
+
+
+def _transaction_depth() -> int:
+    connection = transaction.get_connection()
+    return len(connection.savepoint_ids) + 1 if connection.in_atomic_block else 0
+
+
+@contextmanager
+def log_buffer():
+    """
+    Collects all log entries created with ``log_action`` inside this block
+    and writes them with one ``bulk_create`` when the block is left. Nested
+    blocks are flushed by the outermost one opened in the same transaction,
+    and entries created in an inner transaction are written there, so they
+    are rolled back with it. Entries are dropped if the block raises an
+    exception.
+    """
+    stack = _log_buffers.__dict__.setdefault('stack', [])
+    depth = _transaction_depth()
+    entries = []
+    stack.append((depth, entries))
+    try:
+        yield entries
+    finally:
+        stack.pop()
+    if stack and stack[-1][0] == depth:
+        stack[-1][1].extend(entries)
+    else:
+        _flush_log_entries(entries)
 
 
 class LogMixin:
@@ -10,10 +50,16 @@ class LogMixin:
         if data:
             data = json.dumps(data)
 
-        ActivityLog.objects.create(
-            event=self.event, person=person, content_object=self,
+        entry = ActivityLog(
+            event=self.event, person=person,
+            content_type=ContentType.objects.get_for_model(type(self)), object_id=self.pk,
             action_type=action, data=data, is_orga_action=orga,
         )
+        stack = getattr(_log_buffers, 'stack', None)
+        if stack and stack[-1][0] == _transaction_depth():
+            stack[-1][1].append(entry)
+        else:
+            entry.save()
 
     def logged_actions(self):
         from pretalx.common.models import ActivityLog
@@ -22,3 +68,33 @@ class LogMixin:
             content_type=ContentType.objects.get_for_model(type(self)),
             object_id=self.pk
         ).select_related('event', 'person')
+
+
+class SearchMixin:
+    """
+    Keeps the search index for this object up to date. ``search_fields`` maps
+    the indexed fields to their weight in search results.
+    """
+    search_fields = {}
+
+    def get_search_tokens(self) -> dict:
+        from pretalx.common.models.search import tokenize
+        weights = {}
+        for field, weight in self.search_fields.items():
+            for token in tokenize(getattr(self, field)):
+                weights[token] = max(weights.get(token, 0), weight)
+        return weights
+
+    def update_search_index(self, update_fields=None):
+        from pretalx.common.models import SearchToken
+        if update_fields is not None and not set(update_fields) & set(self.search_fields):
+            return
+        SearchToken.index(self, event=getattr(self, 'event', None))
+
+    def delete(self, *args, **kwargs):
+        from pretalx.common.models import SearchToken
+        pk = self.pk
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            SearchToken.remove(type(self), pk)
+        return result
@@ -1,7 +1,9 @@
 from .log import ActivityLog
+from .search import SearchToken
 from .settings import GlobalSettings
 
 __all__ = [
     'ActivityLog',
+    'SearchToken',
     'GlobalSettings'
 ]
@@ -1,6 +1,8 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from django.utils.translation import ugettext_lazy as _
 
 LOG_NAMES = {
@@ -67,9 +69,35 @@ class ActivityLog(models.Model):
 
     class Meta:
         ordering = ('-timestamp', )
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', 'timestamp']),
+            models.Index(fields=['event', 'timestamp']),
+        ]
 
     def display(self):
         response = LOG_NAMES.get(self.action_type)
         if response is None:
             return self.action_type
         return response
+
+
+LOG_PAGE_SIZE = 50
+
+
+def paginate_logs(queryset, cursor: str=None, size: int=LOG_PAGE_SIZE):
+    """
+    Returns one page of log entries, newest first, and the cursor of the next
+    page (None on the last page). Pages are found by their position in the
+    (timestamp, pk) order instead of an OFFSET, so late pages are as cheap as
+    the first one.
+    """
+    queryset = queryset.order_by('-timestamp', '-pk')
+    timestamp, _, pk = (cursor or '').rpartition('_')
+    timestamp = parse_datetime(timestamp) if timestamp else None
+    if timestamp and pk.isdigit():
+        queryset = queryset.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk))
+    entries = list(queryset[:size + 1])
+    if len(entries) <= size:
+        return entries, None
+    entries = entries[:size]
+    return entries, f'{entries[-1].timestamp.isoformat()}_{entries[-1].pk}'
@@ -0,0 +1,113 @@
+import re
+import unicodedata
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Case, IntegerField, Max, Sum, Value, When
+
+TOKEN_MAX_LENGTH = 64
+SEARCH_MAX_TERMS = 5
+_token_split = re.compile(r'\W+')
+
+
+def tokenize(text) -> list:
+    """
+    Splits text into lowercase, accent-free words of at least two characters.
+    Used both for indexing and for search queries, so they match up.
+    """
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return [
+        token[:TOKEN_MAX_LENGTH]
+        for token in _token_split.split(text.lower())
+        if len(token) >= 2
+    ]
+
+
+class SearchToken(models.Model):
+    """
+    One word of an indexed object, weighted by the field it occurs in. Objects
+    opt in with the SearchMixin, which keeps their tokens up to date.
+    """
+    content_type = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+    )
+    object_id = models.PositiveIntegerField()
+    event = models.ForeignKey(
+        to='event.Event',
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True, blank=True,
+    )
+    token = models.CharField(max_length=TOKEN_MAX_LENGTH, db_index=True)  # Also serves prefix lookups on PostgreSQL
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['content_type', 'token']),
+            models.Index(fields=['content_type', 'object_id']),
+        ]
+
+    @classmethod
+    def index(cls, obj, event=None) -> None:
+        content_type = ContentType.objects.get_for_model(type(obj))
+        weights = obj.get_search_tokens()
+        cls.objects.filter(content_type=content_type, object_id=obj.pk).delete()
+        cls.objects.bulk_create([
+            cls(content_type=content_type, object_id=obj.pk, event=event, token=token, weight=weight)
+            for token, weight in weights.items()
+        ])
+
+    @classmethod
+    def remove(cls, model, pk: int) -> None:
+        cls.objects.filter(content_type=ContentType.objects.get_for_model(model), object_id=pk).delete()
+
+    @classmethod
+    def matching_ids(cls, model, query: str, event=None, within=None):
+        """
+        Returns the ids of the objects of ``model`` matching every word of
+        the query, as a word or a word prefix, best matches first: whole
+        words count double, and matches in heavier fields count more.
+        ``within`` is an optional queryset of ``model`` to restrict the
+        results to. Returns None if the query contains no searchable words.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))[:SEARCH_MAX_TERMS]
+        if not terms:
+            return None
+
+        queryset = cls.objects.filter(content_type=ContentType.objects.get_for_model(model))
+        if event:
+            queryset = queryset.filter(event=event)
+        if within is not None:
+            queryset = queryset.filter(object_id__in=within.values('pk'))
+        matches = models.Q()
+        for term in terms:
+            matches |= models.Q(token__startswith=term)
+        return queryset.filter(matches).values('object_id').annotate(
+            score=Sum(Case(
+                When(token__in=terms, then=models.F('weight') * 2),
+                default=models.F('weight'),
+                output_field=IntegerField(),
+            )),
+            **{
+                f'term_{index}': Max(Case(
+                    When(token__startswith=term, then=Value(1)),
+                    default=Value(0), output_field=IntegerField(),
+                ))
+                for index, term in enumerate(terms)
+            }
+        ).filter(**{f'term_{index}': 1 for index in range(len(terms))}).order_by('-score', 'object_id')
+
+    @classmethod
+    def search(cls, model, query: str, event=None, within=None, limit: int=None) -> list:
+        """ Returns the objects of ``model`` matching the query, see ``matching_ids``. """
+        queryset = cls.matching_ids(model, query, event=event, within=within)
+        if queryset is None:
+            return []
+        if limit:
+            queryset = queryset[:limit]
+
+        ids = [row['object_id'] for row in queryset]
+        objects = model.objects.in_bulk(ids)
+        return [objects[pk] for pk in ids if pk in objects]
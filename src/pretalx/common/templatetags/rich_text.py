@@ -1,6 +1,11 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import bleach
 import markdown
 from django import template
+from django.core.cache import cache
 from django.utils.safestring import mark_safe
 
 register = template.Library()
@@ -42,6 +47,57 @@ ALLOWED_ATTRIBUTES = {
 }
 
 
+# Bump when the rendering changes, to invalidate the shared cache
+RICH_TEXT_VERSION = 1
+RICH_TEXT_CACHE_TIMEOUT = 7 * 24 * 3600
+RICH_TEXT_LRU_SIZE = 1024
+_rendered = OrderedDict()
+_rendered_lock = threading.Lock()
+
+
+def render_markdown(text: str) -> str:
+    return bleach.linkify(bleach.clean(markdown.markdown(text), tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES))
+
+
+def render_markdown_cached(text: str) -> str:
+    """
+    Renders markdown through a per-process LRU cache in front of the shared
+    cache, both keyed by the hash of the text. The LRU cache only keeps the
+    rendered HTML, not the text.
+    """
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    with _rendered_lock:
+        html = _rendered.get(digest)
+        if html is not None:
+            _rendered.move_to_end(digest)
+            return html
+
+    key = f'pretalx:rich_text:{RICH_TEXT_VERSION}:{digest}'
+    html = cache.get(key)
+    if html is None:
+        html = render_markdown(text)
+        cache.set(key, html, RICH_TEXT_CACHE_TIMEOUT)
+    with _rendered_lock:
+        _rendered[digest] = html
+        if len(_rendered) > RICH_TEXT_LRU_SIZE:
+            _rendered.popitem(last=False)
+    return html
+
+
+def clear_rich_text_cache() -> None:
+    with _rendered_lock:
+        _rendered.clear()
+
+
+def warm_rich_text(*texts) -> None:
+    """ Renders texts ahead of time, e.g. on save, so pages find them cached. """
+    for text in texts:
+        data = getattr(text, 'data', text)  # LazyI18nString
+        for value in (data.values() if isinstance(data, dict) else [data]):
+            if value:
+                render_markdown_cached(str(value))
+
+
 @register.filter
 def rich_text(text: str, **kwargs):
     """
@@ -49,6 +105,4 @@ def rich_text(text: str, **kwargs):
     """
     if not text:
         return ""
-    body_md = bleach.linkify(bleach.clean(markdown.markdown(str(text)),
-                                          tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES))
-    return mark_safe(body_md)
+    return mark_safe(render_markdown_cached(str(text)))
@@ -1,7 +1,12 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
 from django.views.generic.detail import SingleObjectTemplateResponseMixin
 from django.views.generic.edit import ModelFormMixin, ProcessFormView
 from i18nfield.forms import I18nModelForm
 
+from pretalx.common.metrics import request_metrics
+
 
 class ActionFromUrl:
     @property
@@ -36,3 +41,10 @@ class CreateOrUpdateView(SingleObjectTemplateResponseMixin, ModelFormMixin, Proc
         except self.model.DoesNotExist:
             self.object = None
         return super().post(request, *args, **kwargs)
+
+
+def metrics_view(request):
+    token = settings.METRICS_TOKEN
+    if not token or not constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), f'Bearer {token}'):
+        raise Http404()
+    return HttpResponse(request_metrics.render(), content_type='text/plain; version=0.0.4')
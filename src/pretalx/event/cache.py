@@ -0,0 +1,81 @@
+from django.core.cache import cache
+
+EVENT_CACHE_TIMEOUT = 3600
+
+
+def _event_key(slug: str) -> str:
+    return f'pretalx:event:slug:{slug}'
+
+
+def _orga_key(user_id: int) -> str:
+    return f'pretalx:event:orga:{user_id}'
+
+
+ALL_EVENTS_KEY = 'pretalx:event:all'
+
+
+def get_event(slug: str):
+    """
+    Resolves an event slug to an Event, going through the shared cache
+    before hitting the database. Returns None for unknown slugs.
+    """
+    from pretalx.event.models import Event
+
+    key = _event_key(slug)
+    event = cache.get(key)
+    if event is None:
+        try:
+            event = Event.objects.get(slug=slug)
+        except Event.DoesNotExist:
+            return None
+        cache.set(key, event, EVENT_CACHE_TIMEOUT)
+    return event
+
+
+def invalidate_event(event, old_slug: str=None) -> None:
+    """
+    Drops everything cached about this event: the slug lookup (for the old
+    slug, too, if it changed), and the orga event lists containing it.
+    """
+    user_ids = event.permissions.filter(user__isnull=False).values_list('user_id', flat=True)
+    cache.delete_many(
+        [_event_key(slug) for slug in (event.slug, old_slug) if slug]
+        + [_orga_key(user_id) for user_id in user_ids]
+        + [ALL_EVENTS_KEY]
+    )
+
+
+def get_orga_events(user) -> list:
+    """
+    Returns all events the user organizes, which is all events for
+    superusers. The list is cached per user.
+    """
+    from pretalx.event.models import Event
+
+    key = ALL_EVENTS_KEY if user.is_superuser else _orga_key(user.pk)
+    events = cache.get(key)
+    if events is None:
+        if user.is_superuser:
+            queryset = Event.objects.all()
+        else:
+            queryset = Event.objects.filter(
+                permissions__user=user,
+                permissions__is_orga=True,
+            ).distinct()
+        events = list(queryset.order_by('pk'))
+        cache.set(key, events, EVENT_CACHE_TIMEOUT)
+    return events
+
+
+def get_orga_event_ids(user) -> set:
+    return {event.pk for event in get_orga_events(user)}
+
+
+def invalidate_orga_events(*user_ids: int) -> None:
+    cache.delete_many([_orga_key(user_id) for user_id in user_ids if user_id])
+
+
+def is_orga(user, event) -> bool:
+    if not event or user.is_anonymous:
+        return False
+    return user.is_superuser or event.pk in get_orga_event_ids(user)
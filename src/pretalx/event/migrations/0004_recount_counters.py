@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def recount_counters(apps, schema_editor):
+    """
+    Fills the counters of existing events, which would otherwise only count
+    changes made after the upgrade. This uses the current models, as the
+    counting logic lives on them, and only loads the event ids.
+    """
+    from pretalx.event.models import Event, EventCounter
+
+    for event in Event.objects.only('pk'):
+        EventCounter.recount(event)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0003_eventcounter'),
+        ('common', '0006_searchtoken'),
+        ('mail', '0002_queuedmail_error'),
+        ('person', '0001_initial'),
+        ('submission', '0003_submission_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_counters, migrations.RunPython.noop),
+    ]
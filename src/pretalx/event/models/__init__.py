@@ -1,5 +1,7 @@
+from .counter import EventCounter
 from .event import Event
 
 __all__ = [
     'Event',
+    'EventCounter',
 ]
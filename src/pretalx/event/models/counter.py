@@ -0,0 +1,109 @@
+from collections import Counter
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Count, F, Value, When
+from django.utils import timezone
+
+
+def submission_counter_names(state: str, submission_type_id: int, content_locale: str) -> list:
+    return [
+        'submissions',
+        f'submissions.state.{state}',
+        f'submissions.type.{submission_type_id}',
+        f'submissions.locale.{content_locale}',
+    ]
+
+
+def submission_day_counter_name(day=None) -> str:
+    return 'submissions.day.{}'.format((day or timezone.now().date()).isoformat())
+
+
+class EventCounter(models.Model):
+    """
+    One statistic of an event, e.g. the number of its submissions in a given
+    state. Counters are changed incrementally wherever the counted objects
+    are saved or deleted, and recounted periodically to fix any drift, see
+    ``pretalx.event.tasks.recount_event_counters``. Counters drift through
+    queryset ``update()`` and ``delete()`` calls outside of the bulk helpers,
+    and through changes that fail after the counter was changed.
+    """
+    event = models.ForeignKey(
+        to='event.Event',
+        on_delete=models.CASCADE,
+        related_name='counters',
+    )
+    name = models.CharField(max_length=100)
+    value = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (('event', 'name'),)
+
+    def __str__(self) -> str:
+        return f'{self.name}: {self.value}'
+
+    @classmethod
+    def change(cls, event_id: int, deltas: dict) -> None:
+        """
+        Adds the given deltas to the named counters, creating them as needed.
+        Usually takes two queries: one to find the existing counters, and one
+        UPDATE for all of them.
+        """
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        existing = set(cls.objects.filter(event_id=event_id, name__in=deltas).values_list('name', flat=True))
+        if existing:
+            cls.objects.filter(event_id=event_id, name__in=existing).update(value=F('value') + Case(
+                *[When(name=name, then=Value(deltas[name])) for name in existing],
+                default=Value(0), output_field=models.IntegerField(),
+            ))
+
+        missing = [name for name in deltas if name not in existing]
+        if not missing:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create([cls(event_id=event_id, name=name, value=deltas[name]) for name in missing])
+        except IntegrityError:  # Some were created concurrently
+            for name in missing:
+                counter, created = cls.objects.get_or_create(event_id=event_id, name=name, defaults={'value': deltas[name]})
+                if not created:
+                    cls.objects.filter(pk=counter.pk).update(value=F('value') + deltas[name])
+
+    @classmethod
+    def compute(cls, event) -> dict:
+        """ Counts everything from scratch, with one aggregate query per statistic. """
+        from pretalx.common.models import ActivityLog
+        from pretalx.person.models import User
+        from pretalx.submission.models import Answer
+
+        values = Counter()
+        rows = event.submissions.values('state', 'submission_type_id', 'content_locale').annotate(count=Count('id'))
+        for row in rows:
+            for name in submission_counter_names(row['state'], row['submission_type_id'], row['content_locale']):
+                values[name] += row['count']
+        created = ActivityLog.objects.filter(event=event, action_type='pretalx.submission.create')
+        for timestamp in created.values_list('timestamp', flat=True):
+            values[submission_day_counter_name(timestamp.date())] += 1
+        for question_id, count in Answer.objects.filter(question__event=event).values_list('question_id').annotate(Count('id')):
+            values['answers'] += count
+            values[f'answers.question.{question_id}'] = count
+        values['speakers'] = User.objects.filter(submissions__event=event).distinct().count()
+        values['pending_mails'] = event.queued_mails.count()
+        return dict(values)
+
+    @classmethod
+    def recount(cls, event) -> dict:
+        """
+        Replaces all counters of the event with freshly computed values. The
+        existing counters are locked meanwhile, so that concurrent changes
+        wait for the recount instead of getting lost.
+        """
+        with transaction.atomic():
+            list(cls.objects.select_for_update().filter(event=event).values_list('pk'))
+            values = cls.compute(event)
+            cls.objects.filter(event=event).delete()
+            cls.objects.bulk_create([
+                cls(event=event, name=name, value=value) for name, value in values.items()
+            ])
+        return values
@@ -100,8 +100,12 @@ class Event(LogMixin, models.Model):
         return [a for a in settings.LANGUAGES_NATURAL_NAMES if a[0] in enabled]
 
     def save(self, *args, **kwargs):
+        from pretalx.event.cache import invalidate_event
+
         was_created = not bool(self.pk)
+        old_slug = None if was_created else Event.objects.filter(pk=self.pk).values_list('slug', flat=True).first()
         super().save(*args, **kwargs)
+        invalidate_event(self, old_slug=old_slug)
 
         if was_created:
             self._build_initial_data()
@@ -130,9 +134,19 @@ class Event(LogMixin, models.Model):
         self.reject_template = self.reject_template or MailTemplate.objects.create(event=self, subject=GENERIC_SUBJECT, text=REJECT_TEXT)
         self.save()
 
+    @cached_property
+    def statistics(self) -> dict:
+        """ All counters of this event by name, see EventCounter. """
+        return dict(self.counters.values_list('name', 'value'))
+
     @cached_property
     def pending_mails(self):
-        return self.queued_mails.count()
+        return self.statistics.get('pending_mails', 0)
+
+    @cached_property
+    def question_schema(self) -> list:
+        from pretalx.submission.cache import get_question_schema
+        return get_question_schema(self)
 
     @cached_property
     def wip_schedule(self):
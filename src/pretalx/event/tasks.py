@@ -0,0 +1,14 @@
+from pretalx.celery_app import app
+
+
+@app.task
+def recount_event_counters(event: int=None):
+    """
+    Recounts the statistics of the given event, or of all events, to fix
+    counters that drifted, e.g. through bulk changes or failed requests.
+    """
+    from pretalx.event.models import Event, EventCounter
+
+    events = Event.objects.all() if event is None else Event.objects.filter(pk=event)
+    for event in events:
+        EventCounter.recount(event)
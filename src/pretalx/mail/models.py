@@ -36,7 +36,7 @@ class MailTemplate(LogMixin, models.Model):
         # TODO: call to_mail
         pass
 
-    def to_mail(self, user, event, locale=None, context=None, skip_queue=False):
+    def to_mail(self, user, event, locale=None, context=None, skip_queue=False, commit=True):
         with override(locale):
             context = TolerantDict(context or dict())
             mail = QueuedMail(
@@ -49,7 +49,7 @@ class MailTemplate(LogMixin, models.Model):
             )
             if skip_queue:
                 mail.send()
-            else:
+            elif commit:
                 mail.save()
         return mail
 
@@ -66,6 +66,20 @@ class QueuedMail(LogMixin, models.Model):
     bcc = models.CharField(max_length=1000, null=True, blank=True)
     subject = models.CharField(max_length=200)  # Use non-i18n fields; this is the final actual to-be-sent version
     text = models.TextField()
+    error = models.TextField(null=True, blank=True)  # Set when sending the mail failed
+
+    def save(self, *args, **kwargs):
+        from pretalx.event.models import EventCounter
+        was_created = not bool(self.pk)
+        super().save(*args, **kwargs)
+        if was_created:
+            EventCounter.change(self.event_id, {'pending_mails': 1})
+
+    def delete(self, *args, **kwargs):
+        from pretalx.event.models import EventCounter
+        result = super().delete(*args, **kwargs)
+        EventCounter.change(self.event_id, {'pending_mails': -1})
+        return result
 
     def send(self):
         from pretalx.common.mail import mail_send_task
@@ -1,7 +1,6 @@
 from django.http import Http404
 from django.urls import resolve
 
-from pretalx.event.models import Event
 from pretalx.orga.utils.i18n import get_javascript_format, get_moment_locale
 
 
@@ -12,7 +11,7 @@ def add_events(request):
         except Http404:
             url_name = ''
         return {
-            'events': list(Event.objects.filter(permissions__is_orga=True, permissions__user=request.user).distinct()),
+            'events': request.orga_events,
             'url_name': url_name,
         }
     return dict()
@@ -1,11 +1,12 @@
 from .cfp import CfPForm, QuestionForm, SubmissionTypeForm
 from .event import EventForm
-from .submission import SubmissionForm
+from .submission import SubmissionFilterForm, SubmissionForm
 
 __all__ = [
     'CfPForm',
     'EventForm',
     'QuestionForm',
+    'SubmissionFilterForm',
     'SubmissionForm',
     'SubmissionTypeForm',
 ]
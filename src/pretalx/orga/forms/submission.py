@@ -1,7 +1,10 @@
 from django import forms
+from django.conf import settings
+from django.utils.translation import ugettext_lazy as _
 
 from pretalx.common.forms import ReadOnlyFlag
-from pretalx.submission.models import Submission
+from pretalx.common.models import SearchToken
+from pretalx.submission.models import Submission, SubmissionStates
 
 
 class SubmissionForm(ReadOnlyFlag, forms.ModelForm):
@@ -12,3 +15,58 @@ class SubmissionForm(ReadOnlyFlag, forms.ModelForm):
             'title', 'submission_type', 'description', 'abstract',
             'notes', 'do_not_record', 'duration',
         ]
+
+
+class SubmissionFilterForm(forms.Form):
+    SORT_CHOICES = (
+        ('title', _('Title')),
+        ('-title', _('Title (descending)')),
+        ('state', _('State')),
+        ('submission_type', _('Type')),
+        ('-id', _('Newest first')),
+        ('id', _('Oldest first')),
+    )
+
+    q = forms.CharField(required=False, label=_('Search'))
+    state = forms.MultipleChoiceField(
+        required=False, label=_('State'),
+        choices=SubmissionStates.get_choices(),
+        widget=forms.CheckboxSelectMultiple,
+    )
+    submission_type = forms.ModelChoiceField(
+        required=False, label=_('Type'),
+        queryset=None,
+    )
+    content_locale = forms.ChoiceField(
+        required=False, label=_('Language'),
+        choices=[('', '---------')] + list(settings.LANGUAGES),
+    )
+    sort = forms.ChoiceField(
+        required=False, label=_('Sort by'),
+        choices=SORT_CHOICES,
+    )
+
+    def __init__(self, *args, event=None, **kwargs):
+        self.event = event
+        super().__init__(*args, **kwargs)
+        self.fields['submission_type'].queryset = event.submission_types.all()
+
+    def filter_queryset(self, queryset):
+        if not self.is_valid():
+            return queryset.order_by('title', 'pk')
+        data = self.cleaned_data
+        if data['q']:
+            queryset = self._search(queryset, data['q'])
+        if data['state']:
+            queryset = queryset.filter(state__in=data['state'])
+        if data['submission_type']:
+            queryset = queryset.filter(submission_type=data['submission_type'])
+        if data['content_locale']:
+            queryset = queryset.filter(content_locale=data['content_locale'])
+        return queryset.order_by(data['sort'] or 'title', 'pk')
+
+    def _search(self, queryset, query):
+        ids = SearchToken.matching_ids(Submission, query, event=self.event)
+        if ids is None:  # Too short for the search index
+            return queryset.filter(title__icontains=query)
+        return queryset.filter(pk__in=ids.values_list('object_id', flat=True))
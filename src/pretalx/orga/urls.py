@@ -1,8 +1,8 @@
 from django.conf.urls import include, url
 
 from .views import (
-    auth, cfp, dashboard, mails, person,
-    schedule, settings, speaker, submission,
+    auth, cfp, dashboard, mails, person, schedule,
+    search, settings, speaker, submission,
 )
 
 orga_urls = [
@@ -16,6 +16,7 @@ orga_urls = [
 
     url('^event/(?P<event>\w+)/', include([
         url('^users$', person.UserList.as_view(), name='event.user_list'),
+        url('^search$', search.SearchView.as_view(), name='event.search'),
 
         url('^$', dashboard.EventDashboardView.as_view(), name='event.dashboard'),
         url('^cfp/questions$', cfp.CfPQuestionList.as_view(), name='cfp.questions.view'),
@@ -47,6 +48,8 @@ orga_urls = [
         ])),
 
         url('^submissions$', submission.SubmissionList.as_view(), name='submissions.list'),
+        url('^submissions/export\.(?P<format>csv|ndjson)$', submission.SubmissionExport.as_view(), name='submissions.export'),
+        url('^submissions/state$', submission.SubmissionStateChange.as_view(), name='submissions.state'),
         url('^submissions/(?P<pk>[0-9]+)/', include([
             url('^$', submission.SubmissionContent.as_view(), name='submissions.content.view'),
             url('^edit$', submission.SubmissionContent.as_view(), name='submissions.content.edit'),
@@ -65,6 +68,7 @@ orga_urls = [
 
         url('^settings$', settings.EventDetail.as_view(), name='settings.event.view'),
         url('^settings/edit$', settings.EventDetail.as_view(), name='settings.event.edit'),
+        url('^settings/logs$', settings.EventLog.as_view(), name='settings.logs'),
         url('^settings/mail$', settings.EventMailSettings.as_view(), name='settings.mail.view'),
         url('^settings/mail/edit$', settings.EventMailSettings.as_view(), name='settings.mail.edit'),
         url('^settings/team$', settings.EventTeam.as_view(), name='settings.team.view'),
@@ -1,6 +1,56 @@
+from django.core.cache import cache
+from django.db.models import (
+    Case, Count, F, IntegerField, OuterRef, Subquery, Value, When,
+)
+from django.db.models.functions import Coalesce
 from django.shortcuts import redirect
 from django.views.generic import TemplateView
 
+from pretalx.event.cache import get_orga_event_ids
+from pretalx.event.models import Event, EventCounter
+from pretalx.schedule.models import Schedule
+from pretalx.submission.models import SubmissionStates
+
+OVERVIEW_CACHE_TIMEOUT = 60
+
+
+def get_event_overview(user) -> list:
+    """
+    Returns one row per event the user organizes, with its submission
+    counts by state, CfP deadline, pending mails and latest schedule
+    release, computed with a single grouped query and cached briefly.
+    """
+    key = 'pretalx:orga:overview:{}'.format('all' if user.is_superuser else user.pk)
+    overview = cache.get(key)
+    if overview is not None:
+        return overview
+
+    queryset = Event.objects.all()
+    if not user.is_superuser:
+        queryset = queryset.filter(pk__in=get_orga_event_ids(user))
+    state_counts = {
+        f'submissions_{state}': Count(Case(
+            When(submissions__state=state, then=Value(1)), output_field=IntegerField(),
+        ))
+        for state, label in SubmissionStates.get_choices()
+    }
+    pending_mails = EventCounter.objects.filter(event=OuterRef('pk'), name='pending_mails').values('value')[:1]
+    latest_release = Schedule.objects.filter(
+        event=OuterRef('pk'), version__isnull=False,
+    ).order_by('-pk').values('version')[:1]
+    overview = list(queryset.annotate(
+        submissions_total=Count('submissions'),
+        cfp_deadline=F('cfp__deadline'),
+        pending_mails_count=Coalesce(Subquery(pending_mails, output_field=IntegerField()), Value(0)),
+        latest_release=Subquery(latest_release),
+        **state_counts,
+    ).values(
+        'slug', 'name', 'date_from', 'date_to', 'submissions_total', 'cfp_deadline',
+        'pending_mails_count', 'latest_release', *state_counts,
+    ).order_by('-date_from', 'slug'))
+    cache.set(key, overview, OVERVIEW_CACHE_TIMEOUT)
+    return overview
+
 
 class DashboardView(TemplateView):
     template_name = 'orga/dashboard.html'
@@ -11,6 +61,40 @@ class DashboardView(TemplateView):
 
         return super().dispatch(request)
 
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx['events'] = get_event_overview(self.request.user)
+        for row in ctx['events']:
+            row['submissions_by_state'] = [
+                (label, row[f'submissions_{state}'])
+                for state, label in SubmissionStates.get_choices()
+                if row[f'submissions_{state}']
+            ]
+        return ctx
+
 
 class EventDashboardView(TemplateView):
     template_name = 'orga/event/dashboard.html'
+    recent_days = 14
+
+    def get_context_data(self, **kwargs):
+        """ Renders only from the event counters, see EventCounter. """
+        ctx = super().get_context_data(**kwargs)
+        event = self.request.event
+        stats = event.statistics
+        ctx['stats'] = stats
+        ctx['submissions_by_state'] = [
+            (label, stats.get(f'submissions.state.{state}', 0))
+            for state, label in SubmissionStates.get_choices()
+        ]
+        ctx['submissions_by_type'] = [
+            (submission_type.name, stats.get(f'submissions.type.{submission_type.pk}', 0))
+            for submission_type in event.submission_types.all()
+        ]
+        ctx['submissions_by_locale'] = [
+            (name, stats.get(f'submissions.locale.{code}', 0))
+            for code, name in event.named_locales
+        ]
+        days = sorted(name for name in stats if name.startswith('submissions.day.'))[-self.recent_days:]
+        ctx['submissions_by_day'] = [(name.rsplit('.', 1)[-1], stats[name]) for name in days]
+        return ctx
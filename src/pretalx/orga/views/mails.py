@@ -3,7 +3,9 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.generic import FormView, ListView, TemplateView, View
 
+from pretalx.common.mail import send_queued_mails_task
 from pretalx.common.views import ActionFromUrl, CreateOrUpdateView
+from pretalx.event.models import EventCounter
 from pretalx.mail.context import get_context_explanation
 from pretalx.mail.models import MailTemplate
 from pretalx.orga.forms.mails import MailTemplateForm, OutboxMailForm
@@ -21,13 +23,12 @@ class OutboxSend(View):
     def dispatch(self, request, *args, **kwargs):
         super().dispatch(request, *args, **kwargs)
         if 'pk' in self.kwargs:
-            mail = self.request.event.queued_mails.get(pk=self.kwargs.get('pk'))
-            mail.log_action('pretalx.mail.sent', person=self.request.user, orga=True)
-            mail.send()
+            mails = [self.request.event.queued_mails.get(pk=self.kwargs.get('pk'))]
         else:
-            for mail in self.request.event.queued_mails.all():
-                mail.log_action('pretalx.mail.sent', person=self.request.user, orga=True)
-                mail.send()
+            mails = list(self.request.event.queued_mails.all())
+        send_queued_mails_task.apply_async(
+            args=([mail.pk for mail in mails], ), kwargs={'person': self.request.user.pk},
+        )
         return redirect(reverse('orga:mails.outbox.list', kwargs={'event': self.request.event.slug}))
 
 
@@ -39,7 +40,8 @@ class OutboxPurge(View):
             mail.log_action('pretalx.mail.delete', person=self.request.user, orga=True)
             mail.delete()
         else:
-            self.request.event.queued_mails.all().delete()
+            deleted = self.request.event.queued_mails.all().delete()[1].get('mail.QueuedMail', 0)
+            EventCounter.change(self.request.event.pk, {'pending_mails': -deleted})
             self.request.event.log_action('pretalx.mail.delete_all')
         return redirect(reverse('orga:mails.outbox.list', kwargs={'event': self.request.event.slug}))
 
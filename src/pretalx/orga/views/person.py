@@ -1,9 +1,12 @@
-from django.db.models import Q
 from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
 from django.views.generic import View
 
+from pretalx.common.models import SearchToken
 from pretalx.person.models import User
 
+TYPEAHEAD_LIMIT = 10
+
 
 class UserList(View):
 
@@ -12,16 +15,20 @@ class UserList(View):
         if not search or len(search) < 2:
             return JsonResponse({'count': 0, 'results': []})
 
-        queryset = User.objects.filter(
-            Q(nick__icontains=search) | Q(name__icontains=search)
-        )
-        return JsonResponse({
-            'count': len(queryset),
+        within = None
+        if request.GET.get('scope') == 'event':
+            within = User.objects.filter(submissions__event=request.event)
+        users = SearchToken.search(User, search, within=within, limit=TYPEAHEAD_LIMIT)
+        response = JsonResponse({
+            'count': len(users),
             'results': [
                 {
                     'nick': user.nick,
                     'name': user.name,
                 }
-                for user in queryset
+                for user in users
             ],
         })
+        # Typeahead widgets ask for the same prefixes over and over
+        patch_cache_control(response, private=True, max_age=60)
+        return response
@@ -1,13 +1,81 @@
+import json
+
+import pytz
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
 from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_datetime
+from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.utils.translation import ugettext as _
+from django.views.decorators.http import etag
 from django.views.generic import TemplateView, View
 from i18nfield.utils import I18nJSONEncoder
 
+from pretalx.person.models import User
+
 
 class ScheduleView(TemplateView):
     template_name = 'orga/schedule/index.html'
 
 
-class RoomList(View):
+def schedule_etag(request, event):
+    schedule = request.event.wip_schedule
+    return ':'.join(str(part) for part in (
+        schedule.pk, schedule.revision, request.event.date_from, request.event.date_to,
+        request.GET.get('fields', ''), request.GET.get('since', ''),
+    ))
+
+
+def parse_move(event, data, pk=None):
+    def parse_time(value):
+        if value is None:
+            return None
+        value = parse_datetime(value)
+        if value is None:
+            raise ValueError('Invalid datetime')
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, pytz.timezone(event.timezone))
+        return value
+
+    return {
+        'id': int(pk or data['id']),
+        'room': int(data['room']) if data.get('room') is not None else None,
+        'start': parse_time(data.get('start')),
+        'end': parse_time(data.get('end')),
+    }
+
+
+def move_talks(schedule, moves):
+    try:
+        revision = schedule.move_talks(moves)
+    except ValidationError as e:
+        return JsonResponse({'error': ' '.join(e.messages)}, status=400)
+    return JsonResponse({
+        'revision': revision,
+        'results': [
+            {'id': talk.pk, 'room': talk.room_id, 'start': talk.start, 'end': talk.end}
+            for talk in schedule.talks.filter(pk__in=[move['id'] for move in moves])
+        ],
+    })
+
+
+class ScheduleApiMixin:
+    """
+    Answers conditional requests with 304 responses as long as the schedule
+    revision has not changed, and asks clients to revalidate every time.
+    """
+
+    @method_decorator(etag(schedule_etag))
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class RoomList(ScheduleApiMixin, View):
 
     def get(self, request, event):
         return JsonResponse({
@@ -25,34 +93,100 @@ class RoomList(View):
         }, encoder=I18nJSONEncoder)
 
 
-class TalkList(View):
+class TalkList(ScheduleApiMixin, View):
+    FIELDS = (
+        'title', 'speakers', 'submission_type', 'state', 'description',
+        'abstract', 'notes', 'duration', 'content_locale', 'do_not_record',
+        'room', 'start', 'end',
+    )
+    DEFERRABLE_FIELDS = ('description', 'abstract', 'notes')
+
+    def get_fields(self):
+        fields = self.request.GET.get('fields')
+        if not fields:
+            return self.FIELDS
+        requested = set(fields.split(','))
+        return [field for field in self.FIELDS if field in requested]
+
+    def get_queryset(self, fields):
+        queryset = self.request.event.wip_schedule.talks.select_related(
+            'submission', 'submission__submission_type', 'room',
+        )
+        if self.since is not None:
+            queryset = queryset.filter(revision__gt=self.since)
+        deferred = [f'submission__{field}' for field in self.DEFERRABLE_FIELDS if field not in fields]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        if 'speakers' in fields:
+            queryset = queryset.prefetch_related(Prefetch(
+                'submission__speakers', queryset=User.objects.only('name', 'nick'),
+            ))
+        return queryset
+
+    def serialize_slot(self, slot, fields):
+        submission = slot.submission
+        data = {
+            'id': slot.pk,
+            'title': submission.title,
+            'submission_type': submission.submission_type.name,
+            'state': submission.state,
+            'duration': submission.duration or submission.submission_type.default_duration,
+            'content_locale': submission.content_locale,
+            'do_not_record': submission.do_not_record,
+            'room': slot.room_id,
+            'start': slot.start,
+            'end': slot.end,
+        }
+        if 'speakers' in fields:
+            data['speakers'] = [
+                {'name': speaker.name, 'nick': speaker.nick}
+                for speaker in submission.speakers.all()
+            ]
+        for field in self.DEFERRABLE_FIELDS:
+            if field in fields:
+                data[field] = getattr(submission, field)
+        return {key: value for key, value in data.items() if key == 'id' or key in fields}
+
+    @cached_property
+    def since(self):
+        try:
+            return int(self.request.GET['since'])
+        except (KeyError, ValueError):
+            return None
 
     def get(self, request, event):
+        """
+        With ?since=<revision>, only slots changed after that revision are
+        listed in 'results'. Deleted slots leave no trace, so 'ids' then
+        lists all current slot ids, and clients drop any slot not in there.
+        """
+        fields = self.get_fields()
         schedule = request.event.wip_schedule
-        return JsonResponse({'results': [
-            {
-                'title': slot.submission.title,
-                'speakers': [
-                    {'name': speaker.name, 'nick': speaker.nick}
-                    for speaker in slot.submission.speakers.all()
-                ],
-                'submission_type': slot.submission.submission_type.name,
-                'state': slot.submission.state,
-                'description': slot.submission.description,
-                'abstract': slot.submission.abstract,
-                'notes': slot.submission.notes,
-                'duration': slot.submission.duration or slot.submission.submission_type.default_duration,
-                'content_locale': slot.submission.content_locale,
-                'do_not_record': slot.submission.do_not_record,
-                'room': slot.room.pk if slot.room else None,
-                'start': slot.start,
-                'end': slot.end,
-            }
-            for slot in schedule.talks.all()
-        ]}, encoder=I18nJSONEncoder)
+        result = {
+            'revision': schedule.revision,
+            'results': [
+                self.serialize_slot(slot, fields)
+                for slot in self.get_queryset(fields)
+            ],
+        }
+        if self.since is not None:
+            result['ids'] = list(schedule.talks.values_list('pk', flat=True))
+        return JsonResponse(result, encoder=I18nJSONEncoder)
+
+    def patch(self, request, event):
+        try:
+            data = json.loads(request.body.decode())
+            moves = [parse_move(request.event, talk) for talk in data['talks']]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return JsonResponse({'error': _('Invalid data.')}, status=400)
+        return move_talks(request.event.wip_schedule, moves)
 
 
 class TalkUpdate(View):
 
     def patch(self, request, event, pk):
-        pass
+        try:
+            move = parse_move(request.event, json.loads(request.body.decode()), pk=pk)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return JsonResponse({'error': _('Invalid data.')}, status=400)
+        return move_talks(request.event.wip_schedule, [move])
@@ -0,0 +1,39 @@
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.generic import View
+
+from pretalx.common.models import SearchToken
+from pretalx.person.models import User
+from pretalx.submission.models import Submission
+
+SEARCH_RESULT_LIMIT = 20
+
+
+class SearchView(View):
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get('q', '')
+        event = request.event
+        submissions = SearchToken.search(Submission, query, event=event, limit=SEARCH_RESULT_LIMIT)
+        speakers = SearchToken.search(
+            User, query, within=User.objects.filter(submissions__event=event), limit=SEARCH_RESULT_LIMIT,
+        )
+        return JsonResponse({
+            'submissions': [
+                {
+                    'code': submission.code,
+                    'title': submission.title,
+                    'state': submission.state,
+                    'url': reverse('orga:submissions.content.view', kwargs={'event': event.slug, 'pk': submission.pk}),
+                }
+                for submission in submissions
+            ],
+            'speakers': [
+                {
+                    'nick': speaker.nick,
+                    'name': speaker.name,
+                    'url': reverse('orga:speakers.view', kwargs={'event': event.slug, 'pk': speaker.pk}),
+                }
+                for speaker in speakers
+            ],
+        })
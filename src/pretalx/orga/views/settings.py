@@ -11,8 +11,10 @@ from django.utils.translation import ugettext_lazy as _
 from django.views.generic import FormView, TemplateView, View
 
 from pretalx.common.mail import mail_send_task
+from pretalx.common.models.log import paginate_logs
 from pretalx.common.urls import build_absolute_uri
 from pretalx.common.views import ActionFromUrl, CreateOrUpdateView
+from pretalx.event.cache import invalidate_orga_events
 from pretalx.event.models import Event
 from pretalx.orga.forms import EventForm
 from pretalx.orga.forms.event import MailSettingsForm
@@ -56,6 +58,16 @@ class EventDetail(ActionFromUrl, CreateOrUpdateView):
         return ret
 
 
+class EventLog(TemplateView):
+    template_name = 'orga/event/logs.html'
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        queryset = self.request.event.log_entries.select_related('person', 'content_type')
+        context['logs'], context['next_cursor'] = paginate_logs(queryset, self.request.GET.get('before'))
+        return context
+
+
 class EventMailSettings(ActionFromUrl, FormView):
     form_class = MailSettingsForm
     template_name = 'orga/settings/mail.html'
@@ -154,7 +166,9 @@ The {event} orga crew (minus you)''').format(event=event.name, invitation_link=i
 class EventTeamRetract(View):
 
     def dispatch(self, request, event, pk):
-        EventPermission.objects.filter(event__slug=event, pk=pk).delete()
+        permissions = EventPermission.objects.filter(event__slug=event, pk=pk)
+        invalidate_orga_events(*permissions.values_list('user_id', flat=True))
+        permissions.delete()
         request.event.log_action('pretalx.event.invite.orga.retract', person=request.user, orga=True)
         return redirect(reverse('orga:settings.team.view', kwargs={'event': event}))
 
@@ -163,6 +177,7 @@ class EventTeamDelete(View):
 
     def dispatch(self, request, event, pk):
         EventPermission.objects.filter(event__slug=event, user__id=pk).update(is_orga=False)
+        invalidate_orga_events(pk)
         return redirect(reverse('orga:settings.team.view', kwargs={'event': event}))
 
 
@@ -1,12 +1,17 @@
 from django.contrib import messages
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext as _
 from django.views.generic import ListView, TemplateView, View
 
 from pretalx.common.views import ActionFromUrl, CreateOrUpdateView
-from pretalx.orga.forms import SubmissionForm
+from pretalx.event.models import EventCounter
+from pretalx.orga.forms import SubmissionFilterForm, SubmissionForm
 from pretalx.person.models import User
+from pretalx.submission.exporters import EXPORTERS
 from pretalx.submission.models import Submission, SubmissionError
 
 
@@ -33,12 +38,49 @@ class SubmissionReject(View):
         return redirect(reverse('orga:submissions.content.view', kwargs=self.kwargs))
 
 
+class SubmissionExport(View):
+    def get(self, request, *args, **kwargs):
+        exporter = EXPORTERS[self.kwargs['format']](request.event)
+        response = StreamingHttpResponse(exporter.stream(), content_type=exporter.content_type)
+        response['Content-Disposition'] = f'attachment; filename="{exporter.filename}"'
+        return response
+
+
+class SubmissionStateChange(View):
+    http_method_names = ['post']
+
+    def post(self, request, *args, **kwargs):
+        action = request.POST.get('action')
+        pks = [pk for pk in request.POST.getlist('submissions') if pk.isdigit()]
+        if action == 'accept':
+            changed = Submission.bulk_accept(request.event, pks, person=request.user)
+            message = _('{count} submissions have been accepted.')
+        elif action == 'reject':
+            changed = Submission.bulk_reject(request.event, pks, person=request.user)
+            message = _('{count} submissions have been rejected.')
+        else:
+            messages.error(request, _('Please choose whether to accept or reject the selected submissions.'))
+            return redirect(reverse('orga:submissions.list', kwargs=self.kwargs))
+
+        messages.success(request, message.format(count=len(changed)))
+        if len(changed) < len(pks):
+            messages.warning(
+                request,
+                _('{count} submissions could not be changed because of their current state.').format(
+                    count=len(pks) - len(changed),
+                ),
+            )
+        return redirect(reverse('orga:submissions.list', kwargs=self.kwargs))
+
+
 class SubmissionSpeakersAdd(View):
     def dispatch(self, request, *args, **kwargs):
         super().dispatch(request, *args, **kwargs)
         submission = self.request.event.submissions.get(pk=self.kwargs.get('pk'))
         speaker = User.objects.get(nick__iexact=request.POST.get('nick'))
         if submission not in speaker.submissions.all():
+            if not speaker.submissions.filter(event=request.event).exists():
+                EventCounter.change(request.event.pk, {'speakers': 1})
             speaker.submissions.add(submission)
             speaker.save(update_fields=['submissions'])
             submission.log_action('pretalx.submission.speakers.add', person=request.user, orga=True)
@@ -57,6 +99,8 @@ class SubmissionSpeakersDelete(View):
         if submission in speaker.submissions.all():
             speaker.submissions.remove(submission)
             speaker.save(update_fields=['submissions'])
+            if not speaker.submissions.filter(event=request.event).exists():
+                EventCounter.change(request.event.pk, {'speakers': -1})
             submission.log_action('pretalx.submission.speakers.remove', person=request.user, orga=True)
             messages.success(request, _('The speaker has been removed from the submission.'))
         else:
@@ -71,7 +115,6 @@ class SubmissionSpeakers(TemplateView):
         context = super().get_context_data(*args, **kwargs)
         context['submission'] = self.request.event.submissions.get(pk=self.kwargs.get('pk'))
         context['speakers'] = context['submission'].speakers.all()
-        context['users'] = User.objects.all()  # TODO: yeah, no
         return context
 
 
@@ -124,6 +167,22 @@ class SubmissionContent(ActionFromUrl, CreateOrUpdateView):
 class SubmissionList(ListView):
     template_name = 'orga/submission/list.html'
     context_object_name = 'submissions'
+    paginate_by = 50
+
+    @cached_property
+    def filter_form(self):
+        return SubmissionFilterForm(self.request.GET, event=self.request.event)
 
     def get_queryset(self):
-        return self.request.event.submissions.all()
+        queryset = self.request.event.submissions.select_related('submission_type').prefetch_related(
+            Prefetch('speakers', queryset=User.objects.only('name', 'nick')),
+        )
+        return self.filter_form.filter_queryset(queryset)
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        params = self.request.GET.copy()
+        params.pop('page', None)
+        context['filter_form'] = self.filter_form
+        context['filter_params'] = params.urlencode()
+        return context
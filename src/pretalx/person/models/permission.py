@@ -30,3 +30,15 @@ class EventPermission(LogMixin, models.Model):
 
     def __str__(self):
         return '{} on {}'.format(self.user, self.event)
+
+    def save(self, *args, **kwargs):
+        from pretalx.event.cache import invalidate_orga_events
+
+        super().save(*args, **kwargs)
+        invalidate_orga_events(self.user_id)
+
+    def delete(self, *args, **kwargs):
+        from pretalx.event.cache import invalidate_orga_events
+
+        super().delete(*args, **kwargs)
+        invalidate_orga_events(self.user_id)
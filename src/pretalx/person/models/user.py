@@ -10,6 +10,8 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
+from pretalx.common.mixins import SearchMixin
+
 
 def nick_validator(value: str) -> None:
     """
@@ -42,7 +44,7 @@ class UserManager(BaseUserManager):
         return user
 
 
-class User(AbstractBaseUser):
+class User(SearchMixin, AbstractBaseUser):
     """
     The pretalx user model: We don't really need last names and fancy stuff, so
     we stick with a nick, and optionally a name and an email address.
@@ -101,9 +103,30 @@ class User(AbstractBaseUser):
     def get_short_name(self) -> str:
         return self.nick
 
+    search_fields = {'nick': 3, 'name': 3}
+
+    def get_search_tokens(self) -> dict:
+        # Nicks are often several words run together, so they are found by
+        # any part, too: every suffix is indexed with a low weight.
+        weights = super().get_search_tokens()
+        nick = self.nick.lower()
+        for start in range(1, len(nick) - 1):
+            weights.setdefault(nick[start:], 1)
+        return weights
+
     def save(self, *args, **kwargs):
+        from pretalx.schedule.models import Schedule, TalkSlot
+
         self.email = self.email.lower()
-        return super().save(args, kwargs)
+        update_fields = kwargs.get('update_fields')
+        old_names = None
+        if self.pk and (update_fields is None or {'name', 'nick'} & set(update_fields)):
+            old_names = User.objects.filter(pk=self.pk).values_list('name', 'nick').first()
+        result = super().save(args, kwargs)
+        self.update_search_index(update_fields)
+        if old_names and old_names != (self.name, self.nick):  # Talks show speaker names
+            Schedule.bump_revisions(TalkSlot.objects.filter(submission__speakers=self))
+        return result
 
     def log_action(self, action, data=None, orga=False):
         from pretalx.common.models import ActivityLog
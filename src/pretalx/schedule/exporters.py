@@ -0,0 +1,204 @@
+import json
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import pytz
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils.timezone import now
+from i18nfield.utils import I18nJSONEncoder
+
+
+class BaseExporter:
+    """
+    Renders a released schedule into a static file. Released schedules never
+    change, so the result is rendered once and stored, see ``store``.
+    """
+    identifier = None
+    content_type = None
+
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self.event = schedule.event
+        self.tz = pytz.timezone(self.event.timezone)
+
+    @property
+    def talks(self):
+        # Slots without an end cannot be exported in any format
+        return self.schedule.scheduled_talks.filter(end__isnull=False).select_related(
+            'submission', 'submission__submission_type', 'room',
+        ).prefetch_related('submission__speakers').order_by('start', 'room__position')
+
+    @property
+    def path(self) -> str:
+        return f'schedules/{self.event.slug}/{self.schedule.pk}/schedule.{self.identifier}'
+
+    def render(self) -> str:
+        raise NotImplementedError()
+
+    def store(self) -> str:
+        if default_storage.exists(self.path):
+            default_storage.delete(self.path)
+        return default_storage.save(self.path, ContentFile(self.render().encode()))
+
+    def open(self):
+        if not default_storage.exists(self.path):
+            self.store()
+        return default_storage.open(self.path)
+
+
+class JSONExporter(BaseExporter):
+    identifier = 'json'
+    content_type = 'application/json'
+
+    def render(self) -> str:
+        return json.dumps({
+            'schedule': {
+                'version': self.schedule.version,
+                'event': {
+                    'slug': self.event.slug,
+                    'name': self.event.name,
+                    'timezone': self.event.timezone,
+                    'date_from': self.event.date_from,
+                    'date_to': self.event.date_to,
+                },
+                'talks': [
+                    {
+                        'code': talk.submission.code,
+                        'title': talk.submission.title,
+                        'abstract': talk.submission.abstract,
+                        'description': talk.submission.description,
+                        'speakers': [speaker.get_display_name() for speaker in talk.submission.speakers.all()],
+                        'submission_type': talk.submission.submission_type.name,
+                        'content_locale': talk.submission.content_locale,
+                        'do_not_record': talk.submission.do_not_record,
+                        'room': talk.room.name,
+                        'start': talk.start,
+                        'end': talk.end,
+                    }
+                    for talk in self.talks
+                ],
+            },
+        }, cls=I18nJSONEncoder)
+
+
+class FrabXmlExporter(BaseExporter):
+    identifier = 'xml'
+    content_type = 'text/xml'
+
+    @staticmethod
+    def _duration(start, end) -> str:
+        minutes = int((end - start).total_seconds() // 60)
+        return '{:02d}:{:02d}'.format(*divmod(minutes, 60))
+
+    def _add_talk(self, parent, talk):
+        submission = talk.submission
+        start = talk.start.astimezone(self.tz)
+        element = ET.SubElement(parent, 'event', id=str(talk.pk), guid=submission.code)
+        for tag, text in (
+            ('date', start.isoformat()),
+            ('start', start.strftime('%H:%M')),
+            ('duration', self._duration(talk.start, talk.end)),
+            ('room', str(talk.room.name)),
+            ('slug', f'{self.event.slug}-{submission.code}'),
+            ('title', submission.title),
+            ('subtitle', ''),
+            ('track', ''),
+            ('type', str(submission.submission_type.name)),
+            ('language', submission.content_locale),
+            ('abstract', submission.abstract or ''),
+            ('description', submission.description or ''),
+        ):
+            ET.SubElement(element, tag).text = text
+        recording = ET.SubElement(element, 'recording')
+        ET.SubElement(recording, 'license').text = ''
+        ET.SubElement(recording, 'optout').text = 'true' if submission.do_not_record else 'false'
+        persons = ET.SubElement(element, 'persons')
+        for speaker in submission.speakers.all():
+            ET.SubElement(persons, 'person', id=str(speaker.pk)).text = speaker.get_display_name()
+        ET.SubElement(element, 'links')
+        ET.SubElement(element, 'attachments')
+
+    def render(self) -> str:
+        days = OrderedDict()
+        for talk in self.talks:
+            rooms = days.setdefault(talk.start.astimezone(self.tz).date(), OrderedDict())
+            rooms.setdefault(talk.room, []).append(talk)
+
+        root = ET.Element('schedule')
+        ET.SubElement(root, 'version').text = self.schedule.version
+        conference = ET.SubElement(root, 'conference')
+        ET.SubElement(conference, 'acronym').text = self.event.slug
+        ET.SubElement(conference, 'title').text = str(self.event.name)
+        ET.SubElement(conference, 'start').text = self.event.date_from.isoformat() if self.event.date_from else ''
+        ET.SubElement(conference, 'end').text = self.event.date_to.isoformat() if self.event.date_to else ''
+        ET.SubElement(conference, 'days').text = str(len(days))
+        ET.SubElement(conference, 'timeslot_duration').text = '00:05'
+
+        for index, (date, rooms) in enumerate(days.items(), start=1):
+            talks = [talk for room_talks in rooms.values() for talk in room_talks]
+            day = ET.SubElement(
+                root, 'day', index=str(index), date=date.isoformat(),
+                start=min(talk.start for talk in talks).astimezone(self.tz).isoformat(),
+                end=max(talk.end for talk in talks).astimezone(self.tz).isoformat(),
+            )
+            for room, room_talks in rooms.items():
+                room_element = ET.SubElement(day, 'room', name=str(room.name))
+                for talk in room_talks:
+                    self._add_talk(room_element, talk)
+
+        return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(root, encoding='unicode')
+
+
+class ICalExporter(BaseExporter):
+    identifier = 'ics'
+    content_type = 'text/calendar'
+
+    @staticmethod
+    def _escape(text) -> str:
+        return str(text or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+    @staticmethod
+    def _fold(line: str) -> str:
+        # RFC 5545 limits content lines to 75 octets, continued with a space
+        parts = []
+        while len(line.encode()) > 75:
+            cut = 75
+            while len(line[:cut].encode()) > 75:
+                cut -= 1
+            parts.append(line[:cut])
+            line = ' ' + line[cut:]
+        parts.append(line)
+        return '\r\n'.join(parts)
+
+    def render(self) -> str:
+        timestamp_format = '%Y%m%dT%H%M%SZ'
+        hostname = urlparse(settings.SITE_URL).hostname
+        created = now().astimezone(pytz.utc).strftime(timestamp_format)
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//pretalx//{}//{}'.format(self.event.slug, self._escape(self.schedule.version)),
+        ]
+        for talk in self.talks:
+            lines += [
+                'BEGIN:VEVENT',
+                f'UID:pretalx-{self.event.slug}-{talk.submission.code}@{hostname}',
+                'DTSTAMP:' + created,
+                'DTSTART:' + talk.start.astimezone(pytz.utc).strftime(timestamp_format),
+                'DTEND:' + talk.end.astimezone(pytz.utc).strftime(timestamp_format),
+                'SUMMARY:' + self._escape(talk.submission.title),
+                'LOCATION:' + self._escape(talk.room.name),
+                'DESCRIPTION:' + self._escape(talk.submission.abstract),
+                'END:VEVENT',
+            ]
+        lines.append('END:VCALENDAR')
+        return '\r\n'.join(self._fold(line) for line in lines) + '\r\n'
+
+
+EXPORTERS = {
+    exporter.identifier: exporter
+    for exporter in (JSONExporter, FrabXmlExporter, ICalExporter)
+}
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 02:38
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0003_auto_20170523_1144'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='talkslot',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
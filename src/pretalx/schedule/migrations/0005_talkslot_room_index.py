@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 02:40
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0004_schedule_revision'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='talkslot',
+            index=models.Index(fields=['schedule', 'room', 'start'], name='schedule_ta_schedul_ba1906_idx'),
+        ),
+    ]
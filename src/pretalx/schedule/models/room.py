@@ -29,3 +29,11 @@ class Room(LogMixin, models.Model):
 
     def __str__(self) -> str:
         return str(self.name)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.event.wip_schedule.bump_revision()
+
+    def delete(self, *args, **kwargs):
+        super().delete(*args, **kwargs)
+        self.event.wip_schedule.bump_revision()
@@ -1,4 +1,8 @@
-from django.db import models
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Case, Value, When
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
@@ -15,23 +19,129 @@ class Schedule(LogMixin, models.Model):
         max_length=200,
         null=True, blank=True,
     )
+    revision = models.PositiveIntegerField(default=0)
 
     class Meta:
         unique_together = (('event', 'version'), )
 
     def freeze(self, name, user=None):
+        from pretalx.schedule.models import TalkSlot
+
         if self.version:
             raise Exception(f'Cannot freeze schedule version: already versioned as "{self.version}".')
 
-        self.version = name
-        self.save(update_fields=['version'])
-        self.log_action('pretalx.schedule.release', person=user, orga=True)
+        with transaction.atomic():
+            self.version = name
+            self.save(update_fields=['version'])
+            self.log_action('pretalx.schedule.release', person=user, orga=True)
 
-        wip_schedule = Schedule.objects.create(event=self.event)
-        for talk in self.talks.all():
-            talk.copy_to_schedule(wip_schedule)
+            # The new WIP schedule continues the revision counter, so that
+            # clients asking for changes since their last revision get all slots
+            revision = Schedule.objects.filter(pk=self.pk).values_list('revision', flat=True).get() + 1
+            wip_schedule = Schedule.objects.create(event=self.event, revision=revision)
+            TalkSlot.objects.bulk_create([
+                TalkSlot(
+                    submission_id=talk.submission_id,
+                    room_id=talk.room_id,
+                    schedule=wip_schedule,
+                    start=talk.start,
+                    end=talk.end,
+                    revision=revision,
+                )
+                for talk in self.talks.all()
+            ])
+
+        from pretalx.schedule.tasks import export_schedule
+        transaction.on_commit(lambda: export_schedule.apply_async(args=(self.pk, )))
         return self, wip_schedule
 
+    def bump_revision(self, talks=None) -> int:
+        """
+        Increments the revision counter, which changes whenever the schedule
+        content changes, and marks the given talks as changed in the new
+        revision.
+        """
+        Schedule.objects.filter(pk=self.pk).update(revision=models.F('revision') + 1)
+        self.revision = Schedule.objects.filter(pk=self.pk).values_list('revision', flat=True).get()
+        if talks is not None:
+            talks.update(revision=self.revision)
+        return self.revision
+
+    @classmethod
+    def bump_revisions(cls, talks) -> None:
+        """
+        Bumps the revision of every WIP schedule containing any of the given
+        talks, e.g. when data shown with the talks changes elsewhere.
+        """
+        talks = talks.filter(schedule__version__isnull=True)
+        for schedule in cls.objects.filter(pk__in=talks.values('schedule_id')):
+            schedule.bump_revision(talks.filter(schedule=schedule))
+
+    def move_talks(self, moves) -> int:
+        """
+        Applies a batch of moves, each a dict with the keys id, room, start and
+        end (room, start and end may be None to unschedule a talk). All moves
+        are checked against each other and the rest of the schedule for
+        overlaps, and then written with a single UPDATE. The schedule row is
+        locked meanwhile, so concurrent moves cannot overlap each other.
+        """
+        from pretalx.schedule.models import TalkSlot
+
+        moves = {move['id']: move for move in moves}
+
+        def case(name):
+            field = TalkSlot._meta.get_field(name)
+            return Case(*[
+                When(pk=pk, then=Value(move[name], output_field=field)) for pk, move in moves.items()
+            ], output_field=field)
+
+        with transaction.atomic():
+            Schedule.objects.select_for_update().filter(pk=self.pk).first()
+            room_ids = self._validate_moves(moves)
+            self._check_overlaps(moves, room_ids)
+            revision = self.bump_revision()
+            self.talks.filter(pk__in=moves.keys()).update(
+                room=case('room'), start=case('start'), end=case('end'), revision=revision,
+            )
+        return revision
+
+    def _validate_moves(self, moves) -> set:
+        """ Checks the moves on their own, and returns the ids of the target rooms. """
+        if len(moves) != self.talks.filter(pk__in=moves.keys()).count():
+            raise ValidationError(_('Unknown talk.'))
+
+        room_ids = {move['room'] for move in moves.values() if move['room'] is not None}
+        if len(room_ids) != self.event.rooms.filter(pk__in=room_ids).count():
+            raise ValidationError(_('Unknown room.'))
+
+        for move in moves.values():
+            if (move['start'] is None) != (move['end'] is None):
+                raise ValidationError(_('A talk needs both a start and an end time.'))
+            if move['start'] is not None and move['start'] >= move['end']:
+                raise ValidationError(_('A talk has to start before it ends.'))
+        return room_ids
+
+    def _check_overlaps(self, moves, room_ids) -> None:
+        scheduled = [
+            (move['room'], move['start'], move['end'])
+            for move in moves.values() if move['room'] is not None and move['start'] is not None
+        ]
+        if not scheduled:
+            return
+        scheduled += self.talks.filter(
+            room_id__in=room_ids,
+            start__lt=max(interval[2] for interval in scheduled),
+            end__gt=min(interval[1] for interval in scheduled),
+        ).exclude(pk__in=moves.keys()).values_list('room_id', 'start', 'end')
+        intervals = defaultdict(list)
+        for room, start, end in scheduled:
+            intervals[room].append((start, end))
+        for room_intervals in intervals.values():
+            room_intervals.sort()
+            for previous, following in zip(room_intervals, room_intervals[1:]):
+                if following[0] < previous[1]:
+                    raise ValidationError(_('Talks in the same room must not overlap.'))
+
     @cached_property
     def scheduled_talks(self):
         return self.talks.filter(
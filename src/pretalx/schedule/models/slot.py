@@ -22,9 +22,19 @@ class TalkSlot(LogMixin, models.Model):
     )
     start = models.DateTimeField(null=True)
     end = models.DateTimeField(null=True)
+    revision = models.PositiveIntegerField(default=0)
 
     class Meta:
         unique_together = (('submission', 'schedule'), )
+        indexes = [
+            models.Index(fields=['schedule', 'room', 'start']),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.revision = self.schedule.bump_revision()
+        if kwargs.get('update_fields'):
+            kwargs['update_fields'] = list(kwargs['update_fields']) + ['revision']
+        super().save(*args, **kwargs)
 
     @property
     def event(self):
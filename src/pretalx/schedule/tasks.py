@@ -0,0 +1,11 @@
+from pretalx.celery_app import app
+
+
+@app.task
+def export_schedule(schedule: int):
+    from pretalx.schedule.exporters import EXPORTERS
+    from pretalx.schedule.models import Schedule
+
+    schedule = Schedule.objects.select_related('event').get(pk=schedule)
+    for exporter in EXPORTERS.values():
+        exporter(schedule).store()
@@ -49,6 +49,10 @@ else:
     EMAIL_USE_TLS = os.environ.get('PRETALX_MAIL_TLS', 'False') == 'True'
     EMAIL_USE_SSL = os.environ.get('PRETALX_MAIL_SSL', 'False') == 'True'
 
+# Outbox mails are sent in batches over one connection, optionally rate limited (mails per second)
+MAIL_BATCH_SIZE = int(os.environ.get('PRETALX_MAIL_BATCH_SIZE', '100'))
+MAIL_RATE_LIMIT = float(os.environ.get('PRETALX_MAIL_RATE_LIMIT', '0'))
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.' + os.getenv('PRETALX_DB_TYPE', 'sqlite3'),
@@ -177,9 +181,32 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'csp.middleware.CSPMiddleware',
+    'pretalx.common.middleware.RequestMetricsMiddleware',
+    'pretalx.common.middleware.LogBufferMiddleware',
     'pretalx.common.middleware.EventPermissionMiddleware',
 ]
 
+# Request metrics, see RequestMetricsMiddleware. The metrics endpoint is only
+# available with a token, to be sent as "Authorization: Bearer <token>".
+METRICS_ENABLED = os.getenv('PRETALX_METRICS', 'False') == 'True'
+METRICS_TOKEN = os.getenv('PRETALX_METRICS_TOKEN', '')
+# Maximum number of queries per view name. Exceeding a budget is logged, or
+# raises an exception with QUERY_BUDGETS_STRICT (used in tests).
+QUERY_BUDGETS = {
+    'cfp:event.submit': 60,
+    'cfp:event.user.submissions': 10,
+    'orga:dashboard': 10,
+    'orga:event.dashboard': 10,
+    'orga:event.search': 10,
+    'orga:event.user_list': 10,
+    'orga:schedule.api.talks': 20,
+    'orga:settings.logs': 10,
+    'orga:submissions.list': 15,
+    'orga:submissions.speakers.view': 12,
+    'orga:submissions.state': 30,
+}
+QUERY_BUDGETS_STRICT = False
+
 try:
     import debug_toolbar  # noqa
     if DEBUG:
@@ -274,7 +301,7 @@ DEBUG_TOOLBAR_CONFIG = {
 
 INTERNAL_IPS = ('127.0.0.1', '::1')
 
-MESSAGE_STORAGE = 'django.contrib.messages.storage.session.SessionStorage'
+MESSAGE_STORAGE = 'django.contrib.messages.storage.fallback.FallbackStorage'
 
 loglevel = 'DEBUG' if DEBUG else 'INFO'
 
@@ -347,3 +374,9 @@ MESSAGE_TAGS = {
 
 # For now, to ease development
 CELERY_TASK_ALWAYS_EAGER = True
+CELERY_BEAT_SCHEDULE = {
+    'recount-event-counters': {
+        'task': 'pretalx.event.tasks.recount_event_counters',
+        'schedule': int(os.getenv('PRETALX_COUNTER_RECOUNT_INTERVAL', 3600)),
+    },
+}
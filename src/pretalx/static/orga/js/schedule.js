@@ -1,7 +1,13 @@
+function getCookie (name) {
+  var match = document.cookie.match(new RegExp('(^|;\\s*)' + name + '=([^;]*)'))
+  return match ? decodeURIComponent(match[2]) : null
+}
+
 var api = {
   http (verb, url, body) {
     var fullHeaders = {}
     fullHeaders['Content-Type'] = 'application/json'
+    fullHeaders['X-CSRFToken'] = getCookie('pretalx_csrftoken')
 
     let options = {
       method: verb || 'GET',
@@ -24,12 +30,28 @@ var api = {
     })
   },
   fetchTalks () {
-    return api.http('GET', window.location + 'api/talks/', null)
+    var fields = 'title,speakers,submission_type,state,duration,room,start,end'
+    return api.http('GET', window.location + 'api/talks/?fields=' + fields, null)
   },
   fetchRooms () {
     return api.http('GET', window.location + 'api/rooms/', null)
   },
-  saveTalk(talk) {
+  saveTalk (talk) {
+    return api.http('PATCH', window.location + 'api/talks/' + talk.id + '/', {
+      room: talk.room,
+      start: talk.start,
+      end: talk.end,
+    })
+  },
+  saveTalks (talks) {
+    return api.http('PATCH', window.location + 'api/talks/', {
+      talks: talks.map((talk) => ({
+        id: talk.id,
+        room: talk.room,
+        start: talk.start,
+        end: talk.end,
+      }))
+    })
   }
 }
 
@@ -1,7 +1,7 @@
 var speakers = new Bloodhound({
   datumTokenizer: Bloodhound.tokenizers.obj.whitespace('value'),
   queryTokenizer: Bloodhound.tokenizers.whitespace,
-  limit: Infinity,
+  limit: 10,
   remote: {
     url: document.getElementById('vars').getAttribute('remoteUrl'),
     wildcard: '%QUERY',
@@ -20,6 +20,7 @@ $('#input-nick').typeahead(null, {
   name: 'nick',
   display: 'value',
   source: speakers,
+  limit: 10,
   templates: {
     suggestion: function(data) {
       return '<div class="tt-suggestion tt-selectable">' + data.value + ' (' + data.name + ')' + '</div>'
@@ -0,0 +1,25 @@
+from django.core.cache import cache
+
+QUESTION_SCHEMA_TIMEOUT = 3600
+
+
+def _question_schema_key(event_id: int) -> str:
+    return f'pretalx:submission:questions:{event_id}'
+
+
+def get_question_schema(event) -> list:
+    """
+    Returns the event's questions in order, with their answer options
+    prefetched, going through the shared cache before hitting the database.
+    Use ``event.question_schema`` to also memoize it for the current request.
+    """
+    key = _question_schema_key(event.pk)
+    questions = cache.get(key)
+    if questions is None:
+        questions = list(event.questions.prefetch_related('options'))
+        cache.set(key, questions, QUESTION_SCHEMA_TIMEOUT)
+    return questions
+
+
+def invalidate_question_schema(event_id: int) -> None:
+    cache.delete(_question_schema_key(event_id))
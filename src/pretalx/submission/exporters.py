@@ -0,0 +1,129 @@
+import csv
+import json
+from collections import OrderedDict
+
+from django.db.models import Prefetch
+
+EXPORT_CHUNK_SIZE = 200
+
+
+class _Echo:
+    """ A file-like object that hands back what is written to it, for csv.writer. """
+
+    def write(self, value):
+        return value
+
+
+class BaseSubmissionExporter:
+    """
+    Streams all submissions of an event with their speakers and answers.
+    Submissions are fetched in chunks of ``EXPORT_CHUNK_SIZE`` ordered by
+    pk, each chunk with its own prefetches, so memory use does not grow with
+    the size of the event.
+    """
+    identifier = None
+    content_type = None
+
+    def __init__(self, event, chunk_size: int=EXPORT_CHUNK_SIZE):
+        self.event = event
+        self.chunk_size = chunk_size
+        self.questions = list(event.questions.all())
+
+    @property
+    def filename(self) -> str:
+        return f'{self.event.slug}-submissions.{self.identifier}'
+
+    def chunks(self):
+        from pretalx.submission.models import Answer
+
+        queryset = self.event.submissions.select_related('submission_type').prefetch_related(
+            'speakers',
+            Prefetch('answers', queryset=Answer.objects.prefetch_related('options')),
+        ).order_by('pk')
+        last_pk = 0
+        while True:
+            chunk = list(queryset.filter(pk__gt=last_pk)[:self.chunk_size])
+            if not chunk:
+                return
+            yield chunk
+            last_pk = chunk[-1].pk
+
+    @staticmethod
+    def answer_value(answer) -> str:
+        options = answer.options.all()
+        if options:
+            return ', '.join(str(option.answer) for option in options)
+        return answer.answer
+
+    def serialize(self, submission) -> OrderedDict:
+        answers = {answer.question_id: answer for answer in submission.answers.all()}
+        return OrderedDict((
+            ('code', submission.code),
+            ('title', submission.title),
+            ('state', submission.state),
+            ('submission_type', str(submission.submission_type.name)),
+            ('duration', submission.duration or submission.submission_type.default_duration),
+            ('content_locale', submission.content_locale),
+            ('speakers', [
+                {'name': speaker.name, 'nick': speaker.nick, 'email': speaker.email}
+                for speaker in submission.speakers.all()
+            ]),
+            ('abstract', submission.abstract),
+            ('description', submission.description),
+            ('notes', submission.notes),
+            ('do_not_record', submission.do_not_record),
+            ('answers', [
+                OrderedDict((
+                    ('id', question.pk),
+                    ('question', str(question.question)),
+                    ('answer', self.answer_value(answers[question.pk]) if question.pk in answers else None),
+                ))
+                for question in self.questions
+            ]),
+        ))
+
+    def stream(self):
+        raise NotImplementedError()
+
+
+class CSVExporter(BaseSubmissionExporter):
+    identifier = 'csv'
+    content_type = 'text/csv'
+
+    columns = (
+        'code', 'title', 'state', 'submission_type', 'duration', 'content_locale',
+        'abstract', 'description', 'notes', 'do_not_record',
+    )
+
+    def stream(self):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(
+            list(self.columns) + ['speakers', 'speaker_emails'] + [str(question.question) for question in self.questions]
+        )
+        for chunk in self.chunks():
+            for submission in chunk:
+                data = self.serialize(submission)
+                yield writer.writerow(
+                    [data[column] for column in self.columns]
+                    + [
+                        ', '.join(speaker['name'] or speaker['nick'] for speaker in data['speakers']),
+                        ', '.join(speaker['email'] for speaker in data['speakers']),
+                    ]
+                    + [answer['answer'] for answer in data['answers']]
+                )
+
+
+class NDJSONExporter(BaseSubmissionExporter):
+    identifier = 'ndjson'
+    content_type = 'application/x-ndjson'
+
+    def stream(self):
+        for chunk in self.chunks():
+            for submission in chunk:
+                yield json.dumps(self.serialize(submission)) + '\n'
+
+
+EXPORTERS = {
+    exporter.identifier: exporter
+    for exporter in (CSVExporter, NDJSONExporter)
+}
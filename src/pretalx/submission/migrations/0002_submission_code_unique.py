@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 02:50
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils.crypto import get_random_string
+
+CODE_CHARSET = 'ABCDEFGHJKLMNPQRSTUVWXYZ3789'
+CODE_LENGTH = 6
+
+
+def deduplicate_codes(apps, schema_editor):
+    """
+    Gives new codes to all submissions sharing a code with an older one, and
+    to all submissions without a code, so that the unique index can be built.
+    """
+    Submission = apps.get_model('submission', 'Submission')
+    duplicates = Submission.objects.values('code').annotate(count=Count('id')).filter(count__gt=1)
+    duplicate_codes = [row['code'] for row in duplicates]
+    used = set(Submission.objects.values_list('code', flat=True))
+    seen = set()
+    for submission in Submission.objects.filter(code__in=duplicate_codes + ['']).order_by('pk'):
+        if submission.code and submission.code not in seen:
+            seen.add(submission.code)
+            continue
+        code = get_random_string(length=CODE_LENGTH, allowed_chars=CODE_CHARSET)
+        while code in used:
+            code = get_random_string(length=CODE_LENGTH, allowed_chars=CODE_CHARSET)
+        used.add(code)
+        Submission.objects.filter(pk=submission.pk).update(code=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submission', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_codes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='submission',
+            name='code',
+            field=models.CharField(max_length=16, unique=True),
+        ),
+    ]
@@ -28,5 +28,10 @@ class CfP(LogMixin, models.Model):
             return now() <= self.deadline
         return True
 
+    def save(self, *args, **kwargs):
+        from pretalx.common.templatetags.rich_text import warm_rich_text
+        super().save(*args, **kwargs)
+        warm_rich_text(self.text)
+
     def __str__(self) -> str:
         return str(self.headline)
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 from i18nfield.fields import I18nCharField
@@ -54,6 +56,18 @@ class Question(LogMixin, models.Model):
     class Meta:
         ordering = ['position']
 
+    def save(self, *args, **kwargs):
+        from pretalx.submission.cache import invalidate_question_schema
+        super().save(*args, **kwargs)
+        invalidate_question_schema(self.event_id)
+
+    def delete(self, *args, **kwargs):
+        from pretalx.submission.cache import invalidate_question_schema
+        event_id = self.event_id
+        result = super().delete(*args, **kwargs)
+        invalidate_question_schema(event_id)
+        return result
+
 
 class AnswerOption(LogMixin, models.Model):
     question = models.ForeignKey(
@@ -72,6 +86,21 @@ class AnswerOption(LogMixin, models.Model):
     def __str__(self):
         return str(self.answer)
 
+    def _event_id(self):
+        return Question.objects.filter(pk=self.question_id).values_list('event_id', flat=True).first()
+
+    def save(self, *args, **kwargs):
+        from pretalx.submission.cache import invalidate_question_schema
+        super().save(*args, **kwargs)
+        invalidate_question_schema(self._event_id())
+
+    def delete(self, *args, **kwargs):
+        from pretalx.submission.cache import invalidate_question_schema
+        event_id = self._event_id()
+        result = super().delete(*args, **kwargs)
+        invalidate_question_schema(event_id)
+        return result
+
 
 class Answer(LogMixin, models.Model):
     question = models.ForeignKey(
@@ -96,3 +125,24 @@ class Answer(LogMixin, models.Model):
 
     def __str__(self):
         return self.answer
+
+    def save(self, *args, **kwargs):
+        was_created = not bool(self.pk)
+        super().save(*args, **kwargs)
+        if was_created:
+            self.update_counters([self], 1)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.update_counters([self], -1)
+        return result
+
+    @staticmethod
+    def update_counters(answers, sign: int) -> None:
+        """ Counts the given answers, which have to be for questions of the same event. """
+        from pretalx.event.models import EventCounter
+        if not answers:
+            return
+        deltas = Counter(f'answers.question.{answer.question_id}' for answer in answers)
+        deltas['answers'] = len(answers)
+        EventCounter.change(answers[0].question.event_id, {name: sign * count for name, count in deltas.items()})
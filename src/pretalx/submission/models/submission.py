@@ -1,10 +1,12 @@
+from collections import Counter
+
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.crypto import get_random_string
 from django.utils.translation import ugettext_lazy as _
 
 from pretalx.common.choices import Choices
-from pretalx.common.mixins import LogMixin
+from pretalx.common.mixins import LogMixin, SearchMixin, log_buffer
 from pretalx.mail.context import template_context_from_submission
 
 
@@ -38,10 +40,10 @@ class SubmissionStates(Choices):
     }
 
 
-class Submission(LogMixin, models.Model):
+class Submission(LogMixin, SearchMixin, models.Model):
     code = models.CharField(
         max_length=16,
-        db_index=True
+        unique=True,
     )
     speakers = models.ManyToManyField(
         to='person.User',
@@ -92,21 +94,105 @@ class Submission(LogMixin, models.Model):
         verbose_name=_('Don\'t record my talk.')
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['event', 'state']),
+            models.Index(fields=['event', 'submission_type']),
+        ]
+
+    # This omits some character pairs completely because they are hard to read even on screens (1/I and O/0)
+    # and includes only one of two characters for some pairs because they are sometimes hard to distinguish in
+    # handwriting (2/Z, 4/A, 5/S, 6/G).
+    CODE_CHARSET = 'ABCDEFGHJKLMNPQRSTUVWXYZ3789'
+    CODE_LENGTH = 6
+
+    @classmethod
+    def _random_code(cls) -> str:
+        return get_random_string(length=cls.CODE_LENGTH, allowed_chars=cls.CODE_CHARSET)
+
     def assign_code(self):
-        # This omits some character pairs completely because they are hard to read even on screens (1/I and O/0)
-        # and includes only one of two characters for some pairs because they are sometimes hard to distinguish in
-        # handwriting (2/Z, 4/A, 5/S, 6/G).
-        charset = list('ABCDEFGHJKLMNPQRSTUVWXYZ3789')
-        while True:
-            code = get_random_string(length=6, allowed_chars=charset)
-            if not Submission.objects.filter(code=code).exists():
-                self.code = code
-                return
+        # Uniqueness is enforced by the database, see save()
+        self.code = self._random_code()
+
+    @classmethod
+    def generate_codes(cls, count: int) -> list:
+        """
+        Returns ``count`` distinct codes not used by any submission yet, with
+        one query per round of candidates instead of one per code.
+        """
+        codes = set()
+        while len(codes) < count:
+            candidates = {cls._random_code() for _ in range(count - len(codes))} - codes
+            taken = set(cls.objects.filter(code__in=candidates).values_list('code', flat=True))
+            codes |= candidates - taken
+        return list(codes)
+
+    @classmethod
+    def assign_codes(cls, submissions) -> None:
+        """ Assigns codes to all submissions without one, e.g. before a bulk_create. """
+        submissions = [submission for submission in submissions if not submission.code]
+        for submission, code in zip(submissions, cls.generate_codes(len(submissions))):
+            submission.code = code
+
+    search_fields = {'title': 3, 'abstract': 2, 'description': 1}
+    counted_fields = ('state', 'submission_type_id', 'content_locale')
 
     def save(self, *args, **kwargs):
-        if not self.code:
+        from pretalx.event.models.counter import submission_counter_names
+
+        was_created = not bool(self.pk)
+        update_fields = kwargs.get('update_fields')
+        old_counters = []
+        if not was_created and (update_fields is None or {'state', 'submission_type', 'content_locale'} & set(update_fields)):
+            old_values = Submission.objects.filter(pk=self.pk).values_list(*self.counted_fields).first()
+            old_counters = submission_counter_names(*old_values) if old_values else []
+        if self.code:
+            super().save(*args, **kwargs)
+        else:
+            self._save_with_new_code(*args, **kwargs)
+        self.update_search_index(update_fields)
+        if was_created or old_counters:
+            self._update_counters(old_counters)
+
+        if not was_created:
+            self._bump_schedule_revision()
+
+    def _save_with_new_code(self, *args, **kwargs):
+        while True:
             self.assign_code()
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                if not Submission.objects.filter(code=self.code).exists():
+                    raise
+
+    def delete(self, *args, **kwargs):
+        from pretalx.event.models import EventCounter
+        from pretalx.event.models.counter import submission_counter_names
+
+        other_speakers = Submission.speakers.through.objects.filter(
+            submission__event_id=self.event_id,
+        ).exclude(submission_id=self.pk).values('user_id')
+        deltas = Counter({'speakers': -self.speakers.exclude(pk__in=other_speakers).count()})
+        deltas.subtract(submission_counter_names(*(getattr(self, field) for field in self.counted_fields)))
+        result = super().delete(*args, **kwargs)
+        EventCounter.change(self.event_id, deltas)
+        return result
+
+    def _update_counters(self, old_counters):
+        from pretalx.event.models import EventCounter
+        from pretalx.event.models.counter import submission_counter_names
+
+        deltas = Counter(submission_counter_names(*(getattr(self, field) for field in self.counted_fields)))
+        deltas.subtract(old_counters)
+        EventCounter.change(self.event_id, deltas)
+
+    def _bump_schedule_revision(self):
+        talks = self.slots.filter(schedule__version__isnull=True)
+        if talks.exists():
+            self.event.wip_schedule.bump_revision(talks)
 
     @property
     def editable(self):
@@ -137,14 +223,98 @@ class Submission(LogMixin, models.Model):
         self.log_action('pretalx.submission.reject', person=person, orga=True)
 
         from pretalx.schedule.models import TalkSlot
-        TalkSlot.objects.filter(submission=self, schedule=self.event.wip_schedule).delete()
+        if TalkSlot.objects.filter(submission=self, schedule=self.event.wip_schedule).delete()[0]:
+            self.event.wip_schedule.bump_revision()
 
         for speaker in self.speakers.all():
-            self.event.accept_template.to_mail(
+            self.event.reject_template.to_mail(
                 user=speaker, event=self.event, context=template_context_from_submission(self),
                 locale=speaker.locale
             )
 
+    @classmethod
+    def bulk_accept(cls, event, pks, person=None) -> list:
+        """
+        Accepts all given submissions of this event that can be accepted, see
+        ``accept``. Returns the accepted submissions.
+        """
+        from pretalx.schedule.models import TalkSlot
+
+        with transaction.atomic():
+            submissions = cls._bulk_change_state(
+                event, pks, (SubmissionStates.SUBMITTED, SubmissionStates.REJECTED),
+                SubmissionStates.ACCEPTED, 'pretalx.submission.accept', person,
+            )
+            if submissions:
+                schedule = event.wip_schedule
+                revision = schedule.bump_revision()
+                TalkSlot.objects.bulk_create([
+                    TalkSlot(submission=submission, schedule=schedule, revision=revision)
+                    for submission in submissions
+                ])
+                cls._bulk_queue_mails(event, event.accept_template, submissions)
+        return submissions
+
+    @classmethod
+    def bulk_reject(cls, event, pks, person=None) -> list:
+        """
+        Rejects all given submissions of this event that can be rejected, see
+        ``reject``. Returns the rejected submissions.
+        """
+        from pretalx.schedule.models import TalkSlot
+
+        with transaction.atomic():
+            submissions = cls._bulk_change_state(
+                event, pks, (SubmissionStates.SUBMITTED, SubmissionStates.ACCEPTED),
+                SubmissionStates.REJECTED, 'pretalx.submission.reject', person,
+            )
+            if submissions:
+                schedule = event.wip_schedule
+                if TalkSlot.objects.filter(submission__in=submissions, schedule=schedule).delete()[0]:
+                    schedule.bump_revision()
+                cls._bulk_queue_mails(event, event.reject_template, submissions)
+        return submissions
+
+    @classmethod
+    def _bulk_change_state(cls, event, pks, previous_states, state, action, person) -> list:
+        """
+        Moves all given submissions currently in one of ``previous_states`` to
+        ``state`` with one UPDATE and logs the transition.
+        """
+        from pretalx.event.models import EventCounter
+
+        submissions = list(
+            event.submissions.filter(pk__in=pks, state__in=previous_states).prefetch_related('speakers')
+        )
+        if not submissions:
+            return []
+
+        cls.objects.filter(pk__in=[submission.pk for submission in submissions]).update(state=state)
+        deltas = Counter()
+        with log_buffer():
+            for submission in submissions:
+                deltas[f'submissions.state.{submission.state}'] -= 1
+                deltas[f'submissions.state.{state}'] += 1
+                submission.state = state
+                submission.log_action(action, person=person, orga=True)
+        EventCounter.change(event.pk, deltas)
+        return submissions
+
+    @staticmethod
+    def _bulk_queue_mails(event, template, submissions) -> None:
+        from pretalx.event.models import EventCounter
+        from pretalx.mail.models import QueuedMail
+
+        mails = QueuedMail.objects.bulk_create([
+            template.to_mail(
+                user=speaker, event=event, context=template_context_from_submission(submission),
+                locale=speaker.locale, commit=False,
+            )
+            for submission in submissions
+            for speaker in submission.speakers.all()
+        ])
+        EventCounter.change(event.pk, {'pending_mails': len(mails)})
+
     def __str__(self):
         return self.title
 
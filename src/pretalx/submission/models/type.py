@@ -28,3 +28,10 @@ class SubmissionType(LogMixin, models.Model):
             name=self.name,
             duration=self.default_duration,
         )
+
+    def save(self, *args, **kwargs):
+        from pretalx.schedule.models import Schedule, TalkSlot
+        was_created = not bool(self.pk)
+        super().save(*args, **kwargs)
+        if not was_created:  # Talks show the name and default duration
+            Schedule.bump_revisions(TalkSlot.objects.filter(submission__submission_type=self))
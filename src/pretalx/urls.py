@@ -2,9 +2,11 @@ from django.conf import settings
 from django.conf.urls import include, url
 
 from .cfp.urls import cfp_urls
+from .common.views import metrics_view
 from .orga.urls import orga_urls
 
 urlpatterns = [
+    url(r'^metrics$', metrics_view, name='metrics'),
     url(r'^orga/', include(orga_urls, namespace='orga')),
     url(r'', include(cfp_urls, namespace='cfp')),
 ]
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import time
+from contextlib import contextmanager
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .generate import generate_event
+
+SCALE = int(os.environ.get('PRETALX_BENCHMARK_SCALE', '500'))
+RESULTS = []
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get('PRETALX_BENCHMARK'):
+        return
+    skip = pytest.mark.skip(reason='Benchmarks only run with PRETALX_BENCHMARK=1.')
+    for item in items:
+        if 'benchmarks' in item.nodeid:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not RESULTS:
+        return
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    output = json.dumps({'commit': commit, 'scale': SCALE, 'results': RESULTS}, indent=2)
+    path = os.environ.get('PRETALX_BENCHMARK_OUTPUT')
+    if path:
+        with open(path, 'w') as f:
+            f.write(output)
+    else:
+        print('\n' + output)
+
+
+@pytest.fixture(scope='session')
+def big_event(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        return generate_event(submissions=SCALE)
+
+
+@pytest.fixture(autouse=True)
+def no_strict_budgets(settings):
+    # Benchmarks measure, the functional tests enforce the budgets
+    settings.QUERY_BUDGETS_STRICT = False
+
+
+@pytest.fixture
+def benchmark():
+    """ Times the block and counts its queries, for the JSON report. """
+    @contextmanager
+    def measure(name):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            yield
+            duration = time.perf_counter() - start
+        RESULTS.append({'name': name, 'seconds': round(duration, 4), 'queries': len(queries)})
+    return measure
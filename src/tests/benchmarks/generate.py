@@ -0,0 +1,108 @@
+import datetime
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.utils.timezone import now
+
+from pretalx.common.models import ActivityLog
+from pretalx.event.models import Event, EventCounter
+from pretalx.mail.models import QueuedMail
+from pretalx.person.models import EventPermission, User
+from pretalx.schedule.models import Room, TalkSlot
+from pretalx.submission.models import (
+    Answer, Question, QuestionVariant, Submission, SubmissionStates,
+)
+
+
+def generate_event(slug='bench', submissions=500, speakers=None, questions=10, rooms=10,
+                   mails=None, log_entries=None, seed=42):
+    """
+    Builds an event of the given size with bulk inserts: speakers, questions
+    with an answer per submission, rooms, half of the submissions accepted
+    and scheduled, pending mails and log entries. Returns the event and its
+    organiser.
+    """
+    rnd = random.Random(seed)
+    speakers = speakers or submissions
+    mails = submissions // 2 if mails is None else mails
+    log_entries = submissions * 2 if log_entries is None else log_entries
+    today = datetime.date.today()
+
+    event = Event.objects.create(
+        name='Benchmark event', slug=slug, email='orga@example.org', is_public=True,
+        date_from=today, date_to=today + datetime.timedelta(days=2),
+    )
+    orga = User.objects.create_user(f'{slug}orga', 'orgapassw0rd', email=f'orga@{slug}.example.org')
+    EventPermission.objects.create(event=event, user=orga, is_orga=True)
+
+    password = make_password('speakerpwd')
+    User.objects.bulk_create([
+        User(nick=f'{slug}speaker{index}', name=f'Speaker {index}', email=f'speaker{index}@{slug}.example.org',
+             password=password)
+        for index in range(speakers)
+    ])
+    speaker_ids = list(User.objects.filter(nick__startswith=f'{slug}speaker').values_list('pk', flat=True))
+
+    Question.objects.bulk_create([
+        Question(event=event, question=f'Question {index}?', variant=QuestionVariant.STRING, position=index)
+        for index in range(questions)
+    ])
+    question_ids = list(event.questions.values_list('pk', flat=True))
+
+    Room.objects.bulk_create([
+        Room(event=event, name=f'Room {index}', position=index) for index in range(rooms)
+    ])
+    room_ids = list(event.rooms.values_list('pk', flat=True))
+
+    submission_type = event.cfp.default_type
+    new_submissions = [
+        Submission(
+            event=event, submission_type=submission_type, title=f'Talk number {index}',
+            abstract='An abstract. ' * 20, description='A longer description. ' * 100,
+            state=SubmissionStates.ACCEPTED if index % 2 else SubmissionStates.SUBMITTED,
+        )
+        for index in range(submissions)
+    ]
+    Submission.assign_codes(new_submissions)
+    Submission.objects.bulk_create(new_submissions)
+    submission_ids = list(event.submissions.order_by('pk').values_list('pk', 'state'))
+
+    Submission.speakers.through.objects.bulk_create([
+        Submission.speakers.through(submission_id=pk, user_id=rnd.choice(speaker_ids))
+        for pk, _ in submission_ids
+    ])
+    Answer.objects.bulk_create([
+        Answer(submission_id=pk, question_id=question_id, answer='An answer')
+        for pk, _ in submission_ids
+        for question_id in question_ids
+    ])
+
+    schedule = event.wip_schedule
+    start = now().replace(minute=0, second=0, microsecond=0)
+    accepted = [pk for pk, state in submission_ids if state == SubmissionStates.ACCEPTED]
+    slots = []
+    for index, pk in enumerate(accepted):
+        slot_start = start + datetime.timedelta(hours=index // len(room_ids))
+        slots.append(TalkSlot(
+            submission_id=pk, schedule=schedule, room_id=room_ids[index % len(room_ids)],
+            start=slot_start, end=slot_start + datetime.timedelta(minutes=45),
+        ))
+    TalkSlot.objects.bulk_create(slots)
+
+    QueuedMail.objects.bulk_create([
+        QueuedMail(event=event, to=f'speaker{index}@{slug}.example.org', reply_to=event.email,
+                   subject=f'Mail {index}', text='Hello! ' * 50)
+        for index in range(mails)
+    ])
+
+    content_type = ContentType.objects.get_for_model(Submission)
+    ActivityLog.objects.bulk_create([
+        ActivityLog(event=event, person_id=orga.pk, content_type=content_type,
+                    object_id=submission_ids[index % len(submission_ids)][0],
+                    action_type='pretalx.submission.update', is_orga_action=True)
+        for index in range(log_entries)
+    ])
+    # Bulk inserts bypass the incrementally maintained counters
+    EventCounter.recount(event)
+    return event, orga
@@ -0,0 +1,72 @@
+import pytest
+from django.urls import reverse
+
+from pretalx.submission.models import Submission
+
+from ..functional.cfp.wizard import WizardSteps
+
+
+@pytest.fixture
+def bench_orga_client(client, big_event):
+    event, orga = big_event
+    client.force_login(orga)
+    return client
+
+
+@pytest.mark.django_db
+def test_submission_wizard_done(client, big_event, benchmark):
+    event, _ = big_event
+    speaker = event.submissions.first().speakers.first()
+    client.force_login(speaker)
+    wizard = WizardSteps()
+    response, url = wizard.get_response_and_url(client, f'/{event.slug}/submit/', method='GET')
+    response, url = wizard.perform_info_wizard(
+        client, response, url, submission_type=event.cfp.default_type.pk,
+    )
+    answers = {f'questions-question_{question.pk}': 'Answer' for question in event.questions.all()}
+    response, url = wizard.perform_question_wizard(client, response, url, answers)
+    with benchmark('cfp:submission_wizard.done'):
+        wizard.perform_profile_form(client, response, url)
+    assert Submission.objects.filter(event=event, title='Submission title').exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('params', ({}, {'state': 'accepted', 'sort': '-title'}, {'q': 'number'}, {'page': 2}))
+def test_submission_list(bench_orga_client, big_event, benchmark, params):
+    event, _ = big_event
+    with benchmark('orga:submissions.list' + (f' {params}' if params else '')):
+        response = bench_orga_client.get(reverse('orga:submissions.list', kwargs={'event': event.slug}), params)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_talk_list(bench_orga_client, big_event, benchmark):
+    event, _ = big_event
+    with benchmark('orga:schedule.api.talks'):
+        response = bench_orga_client.get(reverse('orga:schedule.api.talks', kwargs={'event': event.slug}))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_schedule_freeze(big_event, benchmark):
+    event, orga = big_event
+    with benchmark('Schedule.freeze'):
+        event.wip_schedule.freeze('benchmark', user=orga)
+
+
+@pytest.mark.django_db
+def test_outbox_send(bench_orga_client, big_event, benchmark):
+    event, _ = big_event
+    with benchmark('orga:mails.outbox.send'):
+        response = bench_orga_client.get(reverse('orga:mails.outbox.send', kwargs={'event': event.slug}))
+    assert response.status_code == 302
+    assert not event.queued_mails.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ('orga:settings.logs', 'orga:settings.event.view'))
+def test_log_rendering(bench_orga_client, big_event, benchmark, url_name):
+    event, _ = big_event
+    with benchmark(url_name):
+        response = bench_orga_client.get(reverse(url_name, kwargs={'event': event.slug}))
+    assert response.status_code == 200
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    from django.core.cache import cache
+    cache.clear()
+    return cache
@@ -0,0 +1,54 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('format,content_type', (
+    ('json', 'application/json'),
+    ('xml', 'text/xml'),
+    ('ics', 'text/calendar'),
+))
+def test_schedule_export(client, event, accepted_submission, format, content_type):
+    event.wip_schedule.freeze('v1.0')
+    response = client.get(reverse('cfp:event.schedule.export', kwargs={
+        'event': event.slug, 'version': 'v1.0', 'format': format,
+    }))
+    assert response.status_code == 200
+    assert response['Content-Type'] == content_type
+    assert 'immutable' in response['Cache-Control']
+
+
+@pytest.mark.django_db
+def test_schedule_export_unknown_version(client, event):
+    response = client.get(reverse('cfp:event.schedule.export', kwargs={
+        'event': event.slug, 'version': 'nope', 'format': 'json',
+    }))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_schedule_export_not_public(orga_client, event, accepted_submission):
+    event.wip_schedule.freeze('v1.0')
+    event.is_public = False
+    event.save()
+    response = orga_client.get(reverse('cfp:event.schedule.export', kwargs={
+        'event': event.slug, 'version': 'v1.0', 'format': 'json',
+    }))
+    assert response.status_code == 200
+    assert response['Cache-Control'] == 'private'
+
+
+@pytest.mark.django_db
+def test_schedule_export_fails(client, event, accepted_submission, monkeypatch):
+    from pretalx.schedule.exporters import JSONExporter
+
+    event.wip_schedule.freeze('v1.0')
+
+    def fail(self):
+        raise OSError('Storage is gone')
+
+    monkeypatch.setattr(JSONExporter, 'open', fail)
+    response = client.get(reverse('cfp:event.schedule.export', kwargs={
+        'event': event.slug, 'version': 'v1.0', 'format': 'json',
+    }))
+    assert response.status_code == 404
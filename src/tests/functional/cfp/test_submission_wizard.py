@@ -1,82 +1,17 @@
 import bs4
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from pretalx.submission.models import Submission, SubmissionType
+from pretalx.event.models import EventCounter
+from pretalx.submission.models import (
+    AnswerOption, Question, QuestionVariant, Submission, SubmissionType,
+)
 
+from .wizard import WizardSteps
 
-class TestWizard:
 
-    def get_response_and_url(self, client, url, follow=True, method='POST', data=None):
-        if method == 'GET':
-            response = client.get(url, follow=follow, data=data)
-        elif method == 'POST':
-            response = client.post(url, follow=follow, data=data)
-        current_url = response.redirect_chain[-1][0]
-        return response, current_url
-
-    def get_form_name(self, response):
-        doc = bs4.BeautifulSoup(response.rendered_content, "lxml")
-        input_hidden = doc.select("input[name^=submit_wizard]")[0]
-        return input_hidden['name'], input_hidden['value']
-
-    def perform_init_wizard(self, client):
-        # Start wizard
-        response, current_url = self.get_response_and_url(client, '/test/submit/', method='GET')
-        assert current_url.endswith('/info/')
-        return response, current_url
-
-    def perform_info_wizard(
-        self, client, response, url, next='questions',
-        title='Submission title', content_locale='en', description='Description',
-        abstract='Abstract', notes='Notes', submission_type=None,
-    ):
-        submission_data = {
-            'info-title': title, 'info-content_locale': content_locale,
-            'info-description': description, 'info-abstract': abstract,
-            'info-notes': notes, 'info-submission_type': submission_type,
-        }
-        key, value = self.get_form_name(response)
-        submission_data[key] = value
-        response, current_url = self.get_response_and_url(client, url, data=submission_data)
-        assert current_url.endswith(f'/{next}/')
-        return response, current_url
-
-    def perform_question_wizard(self, client, response, url, data, next='profile'):
-        key, value = self.get_form_name(response)
-        data[key] = value
-        response, current_url = self.get_response_and_url(client, url, data=data)
-        assert current_url.endswith(f'/{next}/')
-        return response, current_url
-
-    def perform_user_wizard(self, client, response, url, username, password, next='profile', email=None, register=False):
-        if register:
-            data = {
-                'user-register_username': username,
-                'user-register_email': email,
-                'user-register_password': password,
-                'user-register_password_repeat': password,
-            }
-        else:
-            data = {
-                'user-login_username': username,
-                'user-login_password': password,
-            }
-        key, value = self.get_form_name(response)
-        data[key] = value
-        response, current_url = self.get_response_and_url(client, url, data=data)
-        assert current_url.endswith(f'/{next}/')
-        return response, current_url
-
-    def perform_profile_form(self, client, response, url, name='Jane Doe', bio='l337 hax0r', next='/me/submissions'):
-        data = {
-            'profile-name': name,
-            'profile-biography': bio,
-        }
-        key, value = self.get_form_name(response)
-        data[key] = value
-        response, current_url = self.get_response_and_url(client, url, data=data)
-        assert current_url.endswith(next)
-        return response, current_url
+class TestWizard(WizardSteps):
 
     @pytest.mark.django_db
     def test_wizard_new_user(self, event, question, client):
@@ -181,6 +116,89 @@ class TestWizard:
         assert s_user.name == 'Jane Doe'
         assert s_user.profiles.get(event=event).biography == 'l337 hax0r'
 
+    @pytest.mark.django_db
+    def test_wizard_saves_choice_answers(self, event, client, user):
+        submission_type = SubmissionType.objects.filter(event=event).first().pk
+        choice = Question.objects.create(event=event, question='Track?', variant=QuestionVariant.CHOICES, required=False)
+        multiple = Question.objects.create(event=event, question='Needs?', variant=QuestionVariant.MULTIPLE, required=False)
+        web = AnswerOption.objects.create(question=choice, answer='Web')
+        AnswerOption.objects.create(question=choice, answer='Hardware')
+        beamer = AnswerOption.objects.create(question=multiple, answer='Beamer')
+        sound = AnswerOption.objects.create(question=multiple, answer='Sound')
+        answer_data = {
+            f'questions-question_{choice.pk}': web.pk,
+            f'questions-question_{multiple.pk}': [beamer.pk, sound.pk],
+        }
+
+        client.force_login(user)
+        response, current_url = self.perform_init_wizard(client)
+        response, current_url = self.perform_info_wizard(client, response, current_url, submission_type=submission_type)
+        response, current_url = self.perform_question_wizard(client, response, current_url, answer_data, next='profile')
+        self.perform_profile_form(client, response, current_url)
+
+        sub = Submission.objects.last()
+        choice_answer = sub.answers.get(question=choice)
+        assert choice_answer.answer == 'Web'
+        assert list(choice_answer.options.all()) == [web]
+        multiple_answer = sub.answers.get(question=multiple)
+        assert multiple_answer.answer == 'Beamer, Sound'
+        assert set(multiple_answer.options.all()) == {beamer, sound}
+
+    def _count_final_step_queries(self, client, event, user, questions):
+        submission_type = SubmissionType.objects.filter(event=event).first().pk
+        answer_data = {f'questions-question_{question.pk}': 'Answer' for question in questions}
+
+        client.force_login(user)
+        response, current_url = self.perform_init_wizard(client)
+        response, current_url = self.perform_info_wizard(client, response, current_url, submission_type=submission_type)
+        response, current_url = self.perform_question_wizard(client, response, current_url, answer_data, next='profile')
+        with CaptureQueriesContext(connection) as context:
+            self.perform_profile_form(client, response, current_url)
+        assert Submission.objects.last().answers.count() == len(questions)
+        return len(context)
+
+    @pytest.mark.django_db
+    def test_wizard_answer_queries_do_not_grow(self, event, client, user):
+        questions = [Question.objects.create(event=event, question='Question', variant=QuestionVariant.STRING, required=False)]
+        # The first submission also creates the event's counters
+        self._count_final_step_queries(client, event, user, questions)
+        few = self._count_final_step_queries(client, event, user, questions)
+
+        questions += [
+            Question.objects.create(event=event, question=f'Question {index}', variant=QuestionVariant.STRING, required=False)
+            for index in range(5)
+        ]
+        EventCounter.objects.bulk_create([
+            EventCounter(event=event, name=f'answers.question.{question.pk}') for question in questions[1:]
+        ])
+        many = self._count_final_step_queries(client, event, user, questions)
+        assert few == many
+
+    @pytest.mark.django_db
+    def test_wizard_cache_storage_skips_session(self, event, client, question, user, locmem_cache, monkeypatch):
+        from pretalx.cfp.views.wizard import SubmitWizard
+        monkeypatch.setattr(SubmitWizard, 'storage_name', 'pretalx.cfp.storage.CacheStorage')
+        submission_type = SubmissionType.objects.filter(event=event).first().pk
+        answer_data = {f'questions-question_{question.pk}': '42', }
+
+        client.force_login(user)
+        with CaptureQueriesContext(connection) as context:
+            response, current_url = self.perform_init_wizard(client)
+            response, current_url = self.perform_info_wizard(client, response, current_url, submission_type=submission_type)
+            response, current_url = self.perform_question_wizard(client, response, current_url, answer_data, next='profile')
+        assert not any('django_session' in query['sql'] and 'SELECT' not in query['sql'] for query in context.captured_queries)
+        self.perform_profile_form(client, response, current_url)
+
+        sub = Submission.objects.last()
+        assert sub.title == 'Submission title'
+        assert sub.answers.get().answer == '42'
+
+    def test_wizard_cache_key_is_safe(self, rf):
+        from pretalx.cfp.storage import CacheStorage
+        storage = CacheStorage('submit_wizard:' + 'tmp id ü\n' * 50, rf.get('/'))
+        assert len(storage.cache_key) < 250
+        assert storage.cache_key.isprintable() and ' ' not in storage.cache_key
+
 
 # TODO: test failed registration
 # TODO: test failed login
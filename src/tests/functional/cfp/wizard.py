@@ -0,0 +1,77 @@
+import bs4
+
+
+class WizardSteps:
+    """ Steps through the submission wizard with the test client. """
+
+    def get_response_and_url(self, client, url, follow=True, method='POST', data=None):
+        if method == 'GET':
+            response = client.get(url, follow=follow, data=data)
+        elif method == 'POST':
+            response = client.post(url, follow=follow, data=data)
+        current_url = response.redirect_chain[-1][0]
+        return response, current_url
+
+    def get_form_name(self, response):
+        doc = bs4.BeautifulSoup(response.rendered_content, "lxml")
+        input_hidden = doc.select("input[name^=submit_wizard]")[0]
+        return input_hidden['name'], input_hidden['value']
+
+    def perform_init_wizard(self, client):
+        # Start wizard
+        response, current_url = self.get_response_and_url(client, '/test/submit/', method='GET')
+        assert current_url.endswith('/info/')
+        return response, current_url
+
+    def perform_info_wizard(
+        self, client, response, url, next='questions',
+        title='Submission title', content_locale='en', description='Description',
+        abstract='Abstract', notes='Notes', submission_type=None,
+    ):
+        submission_data = {
+            'info-title': title, 'info-content_locale': content_locale,
+            'info-description': description, 'info-abstract': abstract,
+            'info-notes': notes, 'info-submission_type': submission_type,
+        }
+        key, value = self.get_form_name(response)
+        submission_data[key] = value
+        response, current_url = self.get_response_and_url(client, url, data=submission_data)
+        assert current_url.endswith(f'/{next}/')
+        return response, current_url
+
+    def perform_question_wizard(self, client, response, url, data, next='profile'):
+        key, value = self.get_form_name(response)
+        data[key] = value
+        response, current_url = self.get_response_and_url(client, url, data=data)
+        assert current_url.endswith(f'/{next}/')
+        return response, current_url
+
+    def perform_user_wizard(self, client, response, url, username, password, next='profile', email=None, register=False):
+        if register:
+            data = {
+                'user-register_username': username,
+                'user-register_email': email,
+                'user-register_password': password,
+                'user-register_password_repeat': password,
+            }
+        else:
+            data = {
+                'user-login_username': username,
+                'user-login_password': password,
+            }
+        key, value = self.get_form_name(response)
+        data[key] = value
+        response, current_url = self.get_response_and_url(client, url, data=data)
+        assert current_url.endswith(f'/{next}/')
+        return response, current_url
+
+    def perform_profile_form(self, client, response, url, name='Jane Doe', bio='l337 hax0r', next='/me/submissions'):
+        data = {
+            'profile-name': name,
+            'profile-biography': bio,
+        }
+        key, value = self.get_form_name(response)
+        data[key] = value
+        response, current_url = self.get_response_and_url(client, url, data=data)
+        assert current_url.endswith(next)
+        return response, current_url
@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from pretalx.submission.models import Submission
+
+
+@pytest.mark.django_db
+def test_event_dashboard_shows_counters(orga_client, event, submission, submission_type):
+    submission.accept()
+    response = orga_client.get(reverse('orga:event.dashboard', kwargs={'event': event.slug}))
+    assert response.status_code == 200
+    assert ('accepted', 1) in [(str(label), count) for label, count in response.context['submissions_by_state']]
+    assert ('Workshop', 1) in [(str(name), count) for name, count in response.context['submissions_by_type']]
+    assert response.context['stats']['pending_mails'] == 1
+
+
+@pytest.mark.django_db
+def test_event_dashboard_query_count(orga_client, event, submission, submission_type):
+    url = reverse('orga:event.dashboard', kwargs={'event': event.slug})
+    with CaptureQueriesContext(connection) as context:
+        orga_client.get(url)
+    for index in range(10):
+        Submission.objects.create(title=f'Submission {index}', event=event, submission_type=submission_type)
+    with CaptureQueriesContext(connection) as other_context:
+        response = orga_client.get(url)
+    assert len(context) == len(other_context)
+    assert response.context['stats']['submissions'] == 11
+
+
+@pytest.mark.django_db
+def test_dashboard_shows_event_overview(orga_client, event, submission):
+    submission.accept()
+    event.cfp.deadline = None
+    event.cfp.save()
+    event.wip_schedule.freeze('v1')
+    response = orga_client.get(reverse('orga:dashboard'))
+    assert response.status_code == 200
+    row, = [row for row in response.context['events'] if row['slug'] == event.slug]
+    assert row['submissions_total'] == 1
+    assert row['submissions_accepted'] == 1
+    assert row['pending_mails_count'] == 1
+    assert row['latest_release'] == 'v1'
+    assert 'v1' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_dashboard_query_count(orga_client, orga_user, event, submission, submission_type):
+    from pretalx.event.models import Event
+    from pretalx.person.models import EventPermission
+
+    with CaptureQueriesContext(connection) as context:
+        orga_client.get(reverse('orga:dashboard'))
+    for index in range(5):
+        other = Event.objects.create(name=f'Event {index}', slug=f'event{index}', email='orga@orga.org')
+        EventPermission.objects.create(event=other, user=orga_user, is_orga=True)
+        Submission.objects.create(title='Submission', event=other, submission_type=other.cfp.default_type)
+    with CaptureQueriesContext(connection) as other_context:
+        response = orga_client.get(reverse('orga:dashboard'))
+    assert len(context) == len(other_context)
+    assert len(response.context['events']) == 6
@@ -25,3 +25,27 @@ def test_user_typeahead(orga_client, event, speaker, other_orga_user, search, re
     if results:
         assert 'nick' in content['results'][0]
         assert 'name' in content['results'][0]
+
+
+@pytest.mark.django_db
+def test_user_typeahead_is_limited_and_cacheable(orga_client, event):
+    from pretalx.orga.views.person import TYPEAHEAD_LIMIT
+    from pretalx.person.models import User
+    for index in range(TYPEAHEAD_LIMIT + 5):
+        User.objects.create_user(f'someone{index}', 'password')
+    User.objects.create_user('some', 'password')
+
+    response = orga_client.get(reverse('orga:event.user_list', kwargs={'event': event.slug}), data={'search': 'some'})
+    content = json.loads(response.content.decode())
+    assert content['count'] == TYPEAHEAD_LIMIT
+    assert content['results'][0]['nick'] == 'some'
+    assert 'max-age=60' in response['Cache-Control']
+
+
+@pytest.mark.django_db
+def test_user_typeahead_event_scope(orga_client, event, submission, speaker, other_speaker):
+    url = reverse('orga:event.user_list', kwargs={'event': event.slug})
+    response = orga_client.get(url, data={'search': 'speaker'})
+    assert json.loads(response.content.decode())['count'] == 2
+    response = orga_client.get(url, data={'search': 'speaker', 'scope': 'event'})
+    assert [user['nick'] for user in json.loads(response.content.decode())['results']] == [speaker.nick]
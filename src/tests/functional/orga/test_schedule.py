@@ -1,6 +1,8 @@
 import json
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 
@@ -24,3 +26,144 @@ def test_talk_list(orga_client, event):
     assert response.status_code == 200
     assert len(content['results']) == 1
     assert content['results'][0]['title']
+
+
+@pytest.mark.django_db
+def test_talk_list_fields(orga_client, event, accepted_submission):
+    response = orga_client.get(
+        reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug}) + '?fields=title,speakers',
+        follow=True,
+    )
+    content = json.loads(response.content.decode())
+    assert response.status_code == 200
+    assert set(content['results'][0].keys()) == {'id', 'title', 'speakers'}
+    assert content['results'][0]['speakers'] == [{'name': 'Jane Speaker', 'nick': 'speaker'}]
+
+
+@pytest.mark.django_db
+def test_talk_list_query_count(orga_client, event, accepted_submission, other_submission, django_assert_num_queries):
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    with CaptureQueriesContext(connection) as one_talk:
+        orga_client.get(url)
+    other_submission.accept()
+    with django_assert_num_queries(len(one_talk.captured_queries)):
+        response = orga_client.get(url)
+    assert len(json.loads(response.content.decode())['results']) == 2
+
+
+@pytest.mark.django_db
+def test_talk_list_etag(orga_client, event, accepted_submission, room):
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    response = orga_client.get(url)
+    etag = response['ETag']
+    assert etag
+
+    response = orga_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    slot = event.wip_schedule.talks.first()
+    slot.room = room
+    slot.save()
+    response = orga_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_talk_list_etag_changes_with_type_and_speakers(orga_client, event, accepted_submission):
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    revision = json.loads(orga_client.get(url).content.decode())['revision']
+
+    submission_type = accepted_submission.submission_type
+    submission_type.default_duration = 45
+    submission_type.save()
+    content = json.loads(orga_client.get(url + f'?since={revision}').content.decode())
+    assert content['revision'] > revision
+    assert len(content['results']) == 1
+
+    speaker = accepted_submission.speakers.first()
+    speaker.name = 'Someone Else'
+    speaker.save()
+    revision, content = content['revision'], json.loads(orga_client.get(url).content.decode())
+    assert content['revision'] > revision
+
+    speaker.save()
+    assert json.loads(orga_client.get(url).content.decode())['revision'] == content['revision']
+
+
+@pytest.mark.django_db
+def test_talk_list_since(orga_client, event, accepted_submission, other_submission):
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    revision = json.loads(orga_client.get(url).content.decode())['revision']
+
+    other_submission.accept()
+    content = json.loads(orga_client.get(url + f'?since={revision}').content.decode())
+    assert content['revision'] > revision
+    assert [talk['title'] for talk in content['results']] == [other_submission.title]
+    assert len(content['ids']) == 2
+
+    accepted_submission.reject()
+    content = json.loads(orga_client.get(url + f'?since={content["revision"]}').content.decode())
+    assert content['results'] == []
+    assert len(content['ids']) == 1
+
+
+@pytest.mark.django_db
+def test_talk_list_since_across_freeze(orga_client, event, accepted_submission, other_submission):
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    other_submission.accept()
+    revision = json.loads(orga_client.get(url).content.decode())['revision']
+
+    event.wip_schedule.freeze('v1')
+    content = json.loads(orga_client.get(url + f'?since={revision}').content.decode())
+    assert content['revision'] > revision
+    assert sorted(talk['id'] for talk in content['results']) == sorted(content['ids'])
+    assert len(content['ids']) == 2
+
+
+@pytest.mark.django_db
+def test_talk_update(orga_client, event, accepted_submission, room):
+    slot = event.wip_schedule.talks.first()
+    response = orga_client.patch(
+        reverse(f'orga:schedule.api.update', kwargs={'event': event.slug, 'pk': slot.pk}),
+        data=json.dumps({'room': room.pk, 'start': '2017-06-01T10:00:00Z', 'end': '2017-06-01T10:30:00Z'}),
+        content_type='application/json',
+    )
+    assert response.status_code == 200, response.content
+    slot.refresh_from_db()
+    assert slot.room == room
+    assert slot.start.hour == 10
+    assert slot.revision == json.loads(response.content.decode())['revision']
+
+
+@pytest.mark.django_db
+def test_talk_update_batch(orga_client, event, accepted_submission, other_submission, room):
+    other_submission.accept()
+    first, second = event.wip_schedule.talks.order_by('pk')
+    url = reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug})
+    talks = [
+        {'id': first.pk, 'room': room.pk, 'start': '2017-06-01T10:00:00Z', 'end': '2017-06-01T10:30:00Z'},
+        {'id': second.pk, 'room': room.pk, 'start': '2017-06-01T10:15:00Z', 'end': '2017-06-01T10:45:00Z'},
+    ]
+
+    response = orga_client.patch(url, data=json.dumps({'talks': talks}), content_type='application/json')
+    assert response.status_code == 400
+    first.refresh_from_db()
+    assert first.room is None
+
+    talks[1]['start'], talks[1]['end'] = '2017-06-01T10:30:00Z', '2017-06-01T11:00:00Z'
+    response = orga_client.patch(url, data=json.dumps({'talks': talks}), content_type='application/json')
+    assert response.status_code == 200, response.content
+    assert len(json.loads(response.content.decode())['results']) == 2
+    assert event.wip_schedule.scheduled_talks.count() == 2
+
+
+@pytest.mark.django_db
+def test_talk_update_invalid_data(orga_client, event, accepted_submission):
+    slot = event.wip_schedule.talks.first()
+    response = orga_client.patch(
+        reverse(f'orga:schedule.api.update', kwargs={'event': event.slug, 'pk': slot.pk}),
+        data=json.dumps({'start': 'tomorrow'}),
+        content_type='application/json',
+    )
+    assert response.status_code == 400
@@ -38,3 +38,24 @@ def test_delete_room(orga_client, event, room):
     )
     assert response.status_code == 200
     assert event.rooms.count() == 0
+
+
+@pytest.mark.django_db
+def test_event_logs(orga_client, event, submission):
+    from pretalx.common.models.log import LOG_PAGE_SIZE
+    for _ in range(LOG_PAGE_SIZE):
+        event.log_action('pretalx.event.update')
+    submission.log_action('pretalx.submission.update')
+    url = reverse('orga:settings.logs', kwargs={'event': event.slug})
+
+    response = orga_client.get(url)
+    assert response.status_code == 200
+    assert len(response.context['logs']) == LOG_PAGE_SIZE
+    assert response.context['logs'][0].action_type == 'pretalx.submission.update'
+    cursor = response.context['next_cursor']
+    assert cursor
+
+    response = orga_client.get(url, {'before': cursor})
+    assert response.status_code == 200
+    assert len(response.context['logs']) == 1
+    assert response.context['next_cursor'] is None
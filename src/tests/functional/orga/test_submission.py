@@ -1,6 +1,7 @@
 import pytest
 from django.urls import reverse
 
+from pretalx.mail.context import template_context_from_submission
 from pretalx.submission.models import SubmissionStates
 
 
@@ -34,3 +35,193 @@ def test_reject_submission(orga_client, submission):
     assert response.status_code == 200
     assert submission.event.queued_mails.count() == 1
     assert submission.state == SubmissionStates.REJECTED
+
+
+def _create_submissions(event, submission_type, speaker, count):
+    from pretalx.submission.models import Submission
+    submissions = []
+    for index in range(count):
+        submission = Submission.objects.create(
+            title=f'Submission {index}', event=event, submission_type=submission_type,
+        )
+        submission.speakers.add(speaker)
+        submissions.append(submission)
+    return submissions
+
+
+@pytest.mark.django_db
+def test_bulk_accept_submissions(orga_client, submission, speaker, submission_type):
+    event = submission.event
+    others = _create_submissions(event, submission_type, speaker, 2)
+    others[1].state = SubmissionStates.CONFIRMED
+    others[1].save()
+
+    response = orga_client.post(
+        reverse('orga:submissions.state', kwargs={'event': event.slug}),
+        {'action': 'accept', 'submissions': [submission.pk, others[0].pk, others[1].pk]},
+        follow=True,
+    )
+    assert response.status_code == 200
+    assert set(event.submissions.filter(state=SubmissionStates.ACCEPTED)) == {submission, others[0]}
+    assert event.wip_schedule.talks.count() == 2
+    assert event.queued_mails.count() == 2
+    assert submission.logged_actions().filter(action_type='pretalx.submission.accept').count() == 1
+
+
+@pytest.mark.django_db
+def test_bulk_reject_submissions(orga_client, submission, speaker, submission_type):
+    event = submission.event
+    submission.accept()
+    event.queued_mails.all().delete()
+
+    response = orga_client.post(
+        reverse('orga:submissions.state', kwargs={'event': event.slug}),
+        {'action': 'reject', 'submissions': [submission.pk]},
+        follow=True,
+    )
+    submission.refresh_from_db()
+    assert response.status_code == 200
+    assert submission.state == SubmissionStates.REJECTED
+    assert not event.wip_schedule.talks.exists()
+    expected = event.reject_template.to_mail(
+        speaker, event, context=template_context_from_submission(submission), commit=False,
+    )
+    assert event.queued_mails.get().text == expected.text
+
+
+@pytest.mark.django_db
+def test_bulk_accept_query_count(orga_client, submission, speaker, submission_type):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    event = submission.event
+    url = reverse('orga:submissions.state', kwargs={'event': event.slug})
+    warmup = _create_submissions(event, submission_type, speaker, 1)
+    few = _create_submissions(event, submission_type, speaker, 1)
+    many = _create_submissions(event, submission_type, speaker, 10)
+
+    # The first acceptance also creates the event's counters
+    orga_client.post(url, {'action': 'accept', 'submissions': [s.pk for s in warmup]})
+    with CaptureQueriesContext(connection) as context:
+        orga_client.post(url, {'action': 'accept', 'submissions': [s.pk for s in few]})
+    with CaptureQueriesContext(connection) as other_context:
+        orga_client.post(url, {'action': 'accept', 'submissions': [s.pk for s in many]})
+    assert len(context) == len(other_context)
+    assert event.submissions.filter(state=SubmissionStates.ACCEPTED).count() == 12
+
+
+@pytest.mark.django_db
+def test_export_submissions_csv(orga_client, submission, speaker, submission_type):
+    import csv
+    from pretalx.submission.models import Answer, Question
+
+    event = submission.event
+    question = Question.objects.create(event=event, question='Shoe size?', position=0)
+    other_question = Question.objects.create(event=event, question='Shoe size?', position=1)
+    Answer.objects.create(question=question, submission=submission, answer='42')
+    Answer.objects.create(question=other_question, submission=submission, answer='43')
+    _create_submissions(event, submission_type, speaker, 3)
+
+    response = orga_client.get(reverse('orga:submissions.export', kwargs={'event': event.slug, 'format': 'csv'}))
+    assert response.status_code == 200
+    assert response.streaming
+    rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+    assert len(rows) == 5
+    assert all(len(row) == len(rows[0]) for row in rows)
+    header, row = rows[0], dict(zip(rows[0], rows[1]))
+    assert row['code'] == submission.code
+    assert row['speakers'] == speaker.name
+    assert header[-2:] == ['Shoe size?', 'Shoe size?']
+    assert rows[1][-2:] == ['42', '43']
+
+
+@pytest.mark.django_db
+def test_export_submissions_ndjson(orga_client, submission, speaker, submission_type):
+    import json
+    from pretalx.submission.exporters import NDJSONExporter
+    from pretalx.submission.models import Answer, Question
+
+    event = submission.event
+    question = Question.objects.create(event=event, question='Shoe size?')
+    Answer.objects.create(question=question, submission=submission, answer='42')
+    _create_submissions(event, submission_type, speaker, 4)
+    lines = list(NDJSONExporter(event, chunk_size=2).stream())
+    assert len(lines) == 5
+    assert json.loads(lines[0])['speakers'][0]['email'] == speaker.email
+    assert json.loads(lines[0])['answers'] == [{'id': question.pk, 'question': 'Shoe size?', 'answer': '42'}]
+
+    response = orga_client.get(reverse('orga:submissions.export', kwargs={'event': event.slug, 'format': 'ndjson'}))
+    assert response.status_code == 200
+    assert b''.join(response.streaming_content).decode().splitlines() == [line.strip() for line in lines]
+
+
+@pytest.mark.django_db
+def test_submission_list_filters(orga_client, submission, speaker, submission_type):
+    event = submission.event
+    others = _create_submissions(event, submission_type, speaker, 3)
+    others[0].state = SubmissionStates.REJECTED
+    others[0].save()
+    url = reverse('orga:submissions.list', kwargs={'event': event.slug})
+
+    response = orga_client.get(url, {'state': SubmissionStates.REJECTED})
+    assert response.status_code == 200
+    assert list(response.context['submissions']) == [others[0]]
+
+    others[1].title = 'Cookies for everyone'
+    others[1].save()
+    response = orga_client.get(url, {'q': 'cook', 'sort': '-id'})
+    assert list(response.context['submissions']) == [others[1]]
+    response = orga_client.get(url, {'q': 'submission', 'sort': '-id'})
+    assert list(response.context['submissions']) == [others[2], others[0], submission]
+
+    response = orga_client.get(url, {'sort': '-title'})
+    assert [s.title for s in response.context['submissions']] == [
+        'Submission 2', 'Submission 0', 'Cookies for everyone', 'A Submission',
+    ]
+
+
+@pytest.mark.django_db
+def test_submission_list_pagination(orga_client, submission, speaker, submission_type):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    event = submission.event
+    url = reverse('orga:submissions.list', kwargs={'event': event.slug})
+    with CaptureQueriesContext(connection) as context:
+        orga_client.get(url)
+    _create_submissions(event, submission_type, speaker, 60)
+    with CaptureQueriesContext(connection) as other_context:
+        response = orga_client.get(url, {'page': 2})
+    assert response.context['paginator'].count == 61
+    assert len(response.context['submissions']) == 11
+    assert len(context) == len(other_context)
+
+
+@pytest.mark.django_db
+def test_search(orga_client, submission, speaker):
+    response = orga_client.get(reverse('orga:event.search', kwargs={'event': submission.event.slug}), {'q': 'submission'})
+    assert response.status_code == 200
+    assert [result['code'] for result in response.json()['submissions']] == [submission.code]
+
+    response = orga_client.get(reverse('orga:event.search', kwargs={'event': submission.event.slug}), {'q': speaker.nick})
+    assert [result['nick'] for result in response.json()['speakers']] == [speaker.nick]
+
+
+@pytest.mark.django_db
+def test_submission_speakers_page_does_not_load_all_users(orga_client, submission):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from pretalx.person.models import User
+
+    url = reverse('orga:submissions.speakers.view', kwargs={'event': submission.event.slug, 'pk': submission.pk})
+    with CaptureQueriesContext(connection) as context:
+        response = orga_client.get(url)
+    size = len(response.content)
+    for index in range(50):
+        User.objects.create_user(f'bystander{index}', 'password')
+    with CaptureQueriesContext(connection) as other_context:
+        response = orga_client.get(url)
+    assert response.status_code == 200
+    assert len(context) == len(other_context)
+    assert len(response.content) == size
+    assert b'bystander' not in response.content
@@ -35,3 +35,7 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
     }
 }
+
+# Fail tests on views exceeding their query budget
+METRICS_ENABLED = True
+QUERY_BUDGETS_STRICT = True
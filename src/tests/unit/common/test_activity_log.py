@@ -0,0 +1,27 @@
+import pytest
+
+from pretalx.common.models.log import paginate_logs
+
+
+@pytest.mark.django_db
+def test_paginate_logs(event):
+    for _ in range(7):
+        event.log_action('pretalx.event.update')
+    queryset = event.logged_actions()
+    expected = list(queryset.order_by('-timestamp', '-pk'))
+
+    seen, cursor = [], None
+    while True:
+        entries, cursor = paginate_logs(queryset, cursor, size=3)
+        seen += entries
+        if not cursor:
+            break
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_paginate_logs_invalid_cursor(event):
+    event.log_action('pretalx.event.update')
+    entries, cursor = paginate_logs(event.logged_actions(), 'nonsense')
+    assert len(entries) == 1
+    assert cursor is None
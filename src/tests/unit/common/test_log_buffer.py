@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from pretalx.common.mixins import log_buffer
+from pretalx.common.models import ActivityLog
+
+
+@pytest.mark.django_db
+def test_log_action_without_buffer(event):
+    event.log_action('pretalx.event.update')
+    assert event.logged_actions().count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_log_buffer_flushes_once(event):
+    event.log_action('pretalx.event.update')
+    with CaptureQueriesContext(connection) as context:
+        with log_buffer():
+            event.log_action('pretalx.event.update')
+    with CaptureQueriesContext(connection) as other_context:
+        with log_buffer():
+            for _ in range(10):
+                event.log_action('pretalx.event.update', data={'foo': 'bar'})
+    assert len(context) == len(other_context)
+    assert event.logged_actions().count() == 12
+
+
+@pytest.mark.django_db(transaction=True)
+def test_log_buffer_flushes_in_transaction(event):
+    with transaction.atomic():
+        with log_buffer():
+            with log_buffer():
+                event.log_action('pretalx.event.update')
+            event.log_action('pretalx.event.update')
+            assert not ActivityLog.objects.exists()
+        assert event.logged_actions().count() == 2
+    assert event.logged_actions().count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_log_buffer_skips_rolled_back_entries(event):
+    with log_buffer():
+        event.log_action('pretalx.event.update')
+        with pytest.raises(ValueError):
+            with transaction.atomic():
+                event.log_action('pretalx.event.update', data={'rolled': 'back'})
+                with log_buffer():
+                    event.log_action('pretalx.event.update', data={'rolled': 'back'})
+                raise ValueError()
+    assert list(event.logged_actions().values_list('data', flat=True)) == [None]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_log_buffer_discarded_on_error(event):
+    with pytest.raises(ValueError):
+        with log_buffer():
+            event.log_action('pretalx.event.update')
+            raise ValueError()
+    assert not ActivityLog.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_log_buffer_middleware(event, rf):
+    from pretalx.common.middleware import LogBufferMiddleware
+
+    def view(request):
+        for _ in range(3):
+            event.log_action('pretalx.event.update')
+        assert not ActivityLog.objects.exists()
+        return 'response'
+
+    assert LogBufferMiddleware(view)(rf.get('/')) == 'response'
+    assert event.logged_actions().count() == 3
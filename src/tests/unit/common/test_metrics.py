@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from pretalx.common.metrics import (
+    QueryBudgetExceeded, QueryCounter, request_metrics,
+)
+from pretalx.event.models import Event
+
+
+@pytest.fixture
+def metrics():
+    request_metrics.reset()
+    yield request_metrics
+    request_metrics.reset()
+
+
+@pytest.mark.django_db
+def test_metrics_recorded(client, event, metrics):
+    event.is_public = True
+    event.save()
+    response = client.get(reverse('cfp:event.start', kwargs={'event': event.slug}))
+    assert response.status_code == 200
+
+    values = metrics.get('cfp:event.start')
+    assert values['requests'] == 1
+    assert values['queries'] > 0
+    assert values['template_time'] > 0
+    assert values['total_time'] >= values['template_time']
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_needs_token(client, settings, metrics):
+    settings.METRICS_TOKEN = 'secret'
+    assert client.get('/metrics').status_code == 404
+    assert client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code == 404
+
+    metrics.record('cfp:event.start', queries=3, db_time=0.5, template_time=0.1, total_time=1)
+    response = client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert 'pretalx_request_queries_total{view="cfp:event.start"} 3' in content
+    assert '# TYPE pretalx_requests_total counter' in content
+
+
+@pytest.mark.django_db
+def test_metrics_logged(client, event, metrics, caplog):
+    import logging
+    with caplog.at_level(logging.INFO, logger='pretalx.metrics'):
+        client.get(reverse('cfp:event.start', kwargs={'event': event.slug}))
+    records = [record for record in caplog.records if record.name == 'pretalx.metrics']
+    record = json.loads(records[-1].getMessage())
+    assert record['view'] == 'cfp:event.start'
+    assert 'db_time' in record
+
+
+@pytest.mark.django_db
+def test_query_budget(client, event, settings, metrics):
+    settings.QUERY_BUDGETS = {'cfp:event.start': 0}
+    with pytest.raises(QueryBudgetExceeded):
+        client.get(reverse('cfp:event.start', kwargs={'event': event.slug}))
+
+
+@pytest.mark.django_db
+def test_query_counter(event):
+    with QueryCounter(connection) as outer:
+        with QueryCounter(connection) as inner, CaptureQueriesContext(connection) as captured:
+            Event.objects.count()
+            list(Event.objects.all())
+        Event.objects.count()
+    assert inner.count == len(captured) == 2
+    assert outer.count == 3
+    assert outer.time >= inner.time > 0
+    assert 'make_cursor' not in vars(outer.connection)
@@ -0,0 +1,54 @@
+import pytest
+from i18nfield.strings import LazyI18nString
+
+from pretalx.common.templatetags import rich_text as rich_text_module
+from pretalx.common.templatetags.rich_text import rich_text, warm_rich_text
+
+
+@pytest.fixture
+def count_renders(monkeypatch):
+    rich_text_module.clear_rich_text_cache()
+    calls = []
+    original = rich_text_module.render_markdown
+
+    def render(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(rich_text_module, 'render_markdown', render)
+    yield calls
+    rich_text_module.clear_rich_text_cache()
+
+
+def test_rich_text_renders_and_cleans(count_renders):
+    assert rich_text('**bold** <script>x</script>') == '<p><strong>bold</strong> &lt;script&gt;x&lt;/script&gt;</p>'
+    assert rich_text('') == ''
+
+
+def test_rich_text_is_cached(count_renders):
+    for _ in range(3):
+        rich_text('*cached*')
+    rich_text('*other*')
+    assert count_renders == ['*cached*', '*other*']
+
+
+def test_warm_rich_text(count_renders):
+    warm_rich_text(LazyI18nString({'en': '# Hello', 'de': '# Hallo'}), None, '')
+    assert sorted(count_renders) == ['# Hallo', '# Hello']
+    rich_text('# Hello')
+    assert len(count_renders) == 2
+
+
+@pytest.mark.django_db
+def test_cfp_save_warms_rich_text(event, count_renders):
+    event.cfp.text = 'Submit *now*!'
+    event.cfp.save()
+    assert count_renders == ['Submit *now*!']
+
+
+def test_rich_text_cache_is_bounded(count_renders, monkeypatch):
+    monkeypatch.setattr(rich_text_module, 'RICH_TEXT_LRU_SIZE', 2)
+    for text in ('one', 'two', 'one', 'three', 'one', 'two'):
+        rich_text(text)
+    assert count_renders == ['one', 'two', 'three', 'two']
+    assert len(rich_text_module._rendered) == 2
@@ -0,0 +1,69 @@
+import pytest
+from django.core.management import call_command
+
+from pretalx.common.models import SearchToken
+from pretalx.common.models.search import tokenize
+from pretalx.person.models import User
+from pretalx.submission.models import Submission
+
+
+def test_tokenize():
+    assert tokenize('Héllo, wörld! A B-side') == ['hello', 'world', 'side']
+    assert tokenize(None) == []
+    assert tokenize('Привет, Ёжик! 東京 Łódź') == ['привет', 'ежик', '東京', 'łodz']
+
+
+@pytest.mark.django_db
+def test_search_non_latin_names():
+    user = User.objects.create_user('yuki', 'password', name='山田 ゆき')
+    other = User.objects.create_user('sasha', 'password', name='Александр Пушкин')
+    assert SearchToken.search(User, '山田') == [user]
+    assert SearchToken.search(User, 'алекс') == [other]
+
+
+@pytest.mark.django_db
+def test_search_submissions(submission):
+    other = Submission.objects.create(
+        title='Cookies for everyone', abstract='About a submission', event=submission.event,
+        submission_type=submission.submission_type,
+    )
+    assert SearchToken.search(Submission, 'cookie', event=submission.event) == [other]
+    # Title matches rank above abstract matches
+    assert SearchToken.search(Submission, 'submission', event=submission.event) == [submission, other]
+    assert SearchToken.search(Submission, 'submission cookies') == [other]
+    assert SearchToken.search(Submission, 'nothing') == []
+
+    other.title = 'Biscuits'
+    other.save()
+    assert SearchToken.search(Submission, 'cookie') == []
+
+    other.delete()
+    assert not SearchToken.objects.filter(object_id=other.pk, token='biscuits').exists()
+
+
+@pytest.mark.django_db
+def test_search_users():
+    user = User.objects.create_user('jane', 'password', name='Jane Doe')
+    User.objects.create_user('john', 'password', name='John Smith')
+    assert SearchToken.search(User, 'ja') == [user]
+    assert [u.nick for u in SearchToken.search(User, 'jo', within=User.objects.filter(nick='john'))] == ['john']
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index(submission):
+    SearchToken.objects.all().delete()
+    assert SearchToken.search(Submission, submission.title) == []
+    call_command('rebuild_search_index')
+    assert SearchToken.search(Submission, submission.title) == [submission]
+
+
+@pytest.mark.django_db
+def test_search_index_kept_when_delete_fails(submission):
+    from django.db.models import ProtectedError
+    from pretalx.submission.models import Answer, Question
+
+    question = Question.objects.create(event=submission.event, question='Shoe size?')
+    Answer.objects.create(question=question, submission=submission, answer='42')
+    with pytest.raises(ProtectedError):
+        submission.delete()
+    assert SearchToken.search(Submission, submission.title) == [submission]
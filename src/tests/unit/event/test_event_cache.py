@@ -0,0 +1,65 @@
+import pytest
+
+from pretalx.event.cache import (
+    get_event, get_orga_event_ids, get_orga_events, is_orga,
+)
+from pretalx.person.models import EventPermission, User
+
+
+@pytest.mark.django_db
+def test_get_event_is_cached(event, locmem_cache, django_assert_num_queries):
+    assert get_event(event.slug) == event
+    with django_assert_num_queries(0):
+        assert get_event(event.slug) == event
+
+
+@pytest.mark.django_db
+def test_get_event_unknown_slug(locmem_cache):
+    assert get_event('nope') is None
+
+
+@pytest.mark.django_db
+def test_get_event_invalidated_on_save(event, locmem_cache):
+    get_event(event.slug)
+    event.is_public = not event.is_public
+    event.save()
+    assert get_event(event.slug).is_public == event.is_public
+
+
+@pytest.mark.django_db
+def test_get_event_invalidated_on_slug_change(event, locmem_cache):
+    old_slug = event.slug
+    get_event(old_slug)
+    event.slug = 'newslug'
+    event.save()
+    assert get_event(old_slug) is None
+    assert get_event('newslug') == event
+
+
+@pytest.mark.django_db
+def test_orga_event_ids(event, locmem_cache, django_assert_num_queries):
+    user = User.objects.create_user('orga', 'orgapassw0rd')
+    assert not is_orga(user, event)
+    permission = EventPermission.objects.create(user=user, event=event, is_orga=True)
+    assert is_orga(user, event)
+    with django_assert_num_queries(0):
+        assert get_orga_event_ids(user) == {event.pk}
+    permission.delete()
+    assert not is_orga(user, event)
+
+
+@pytest.mark.django_db
+def test_orga_events_invalidated_on_event_save(event, locmem_cache):
+    user = User.objects.create_user('orga', 'orgapassw0rd')
+    EventPermission.objects.create(user=user, event=event, is_orga=True)
+    assert [str(e.name) for e in get_orga_events(user)] == ['Event']
+    event.name = 'Renamed'
+    event.save()
+    assert [str(e.name) for e in get_orga_events(user)] == ['Renamed']
+
+
+@pytest.mark.django_db
+def test_superuser_organizes_all_events(event, locmem_cache):
+    user = User.objects.create_superuser('admin', 'adminpassw0rd')
+    assert get_orga_events(user) == [event]
+    assert is_orga(user, event)
@@ -0,0 +1,111 @@
+import pytest
+from django.core.management import call_command
+
+from pretalx.event.models import Event, EventCounter
+from pretalx.event.tasks import recount_event_counters
+from pretalx.mail.models import QueuedMail
+from pretalx.submission.models import (
+    Answer, Question, Submission, SubmissionStates,
+)
+
+
+def counters(event) -> dict:
+    return dict(EventCounter.objects.filter(event=event).exclude(value=0).values_list('name', 'value'))
+
+
+@pytest.mark.django_db
+def test_change_creates_and_updates_counters(event):
+    EventCounter.change(event.pk, {'a': 1, 'b': 2})
+    EventCounter.change(event.pk, {'a': 2, 'b': -2, 'c': 0})
+    assert dict(event.counters.values_list('name', 'value')) == {'a': 3, 'b': 0}
+
+
+@pytest.mark.django_db
+def test_submission_counters(event, submission):
+    submission_type = event.cfp.default_type
+    assert counters(event)['submissions'] == 1
+    assert counters(event)['submissions.state.submitted'] == 1
+    assert counters(event)[f'submissions.type.{submission_type.pk}'] == 1
+
+    submission.accept()
+    values = counters(event)
+    assert 'submissions.state.submitted' not in values
+    assert values['submissions.state.accepted'] == 1
+    assert values['pending_mails'] == 1
+
+    other = Submission.objects.create(title='Other', event=event, submission_type=submission_type)
+    other.speakers.add(*submission.speakers.all())
+    Submission.bulk_reject(event, [submission.pk, other.pk])
+    values = counters(event)
+    assert values['submissions'] == 2
+    assert values['submissions.state.rejected'] == 2
+    assert 'submissions.state.accepted' not in values
+    assert values['pending_mails'] == 3
+
+
+@pytest.mark.django_db
+def test_pending_mails_counter(event):
+    mail = QueuedMail.objects.create(event=event, to='a@example.org', reply_to='b@example.org', subject='Hi', text='Hi')
+    assert Event.objects.get(pk=event.pk).pending_mails == 1
+    mail.delete()
+    assert Event.objects.get(pk=event.pk).pending_mails == 0
+
+
+@pytest.mark.django_db
+def test_answer_counters(event, submission):
+    question = Question.objects.create(event=event, question='Shoe size?')
+    answer = Answer.objects.create(question=question, submission=submission, answer='42')
+    assert counters(event)['answers'] == 1
+    assert counters(event)[f'answers.question.{question.pk}'] == 1
+    answer.delete()
+    assert 'answers' not in counters(event)
+
+
+@pytest.mark.django_db
+def test_recount_matches_incremental_counters(event, submission):
+    question = Question.objects.create(event=event, question='Shoe size?')
+    Answer.objects.create(question=question, submission=submission, answer='42')
+    submission.accept()
+    EventCounter.change(event.pk, {'speakers': 1})
+    incremental = counters(event)
+
+    assert EventCounter.compute(event) == incremental
+
+
+@pytest.mark.django_db
+def test_recount_task_fixes_drift(event, submission):
+    EventCounter.change(event.pk, {'submissions': 5, 'pending_mails': 3})
+    Submission.objects.filter(pk=submission.pk).update(state=SubmissionStates.WITHDRAWN)
+
+    recount_event_counters()
+    values = counters(event)
+    assert values['submissions'] == 1
+    assert values['submissions.state.withdrawn'] == 1
+    assert 'submissions.state.submitted' not in values
+    assert 'pending_mails' not in values
+    assert values['speakers'] == 1
+
+
+@pytest.mark.django_db
+def test_submission_delete_counters(event, submission):
+    speaker = submission.speakers.get()
+    other = Submission.objects.create(title='Other', event=event, submission_type=submission.submission_type)
+    other.speakers.add(speaker)
+    EventCounter.recount(event)
+    assert counters(event)['speakers'] == 1
+    submission.delete()
+    values = counters(event)
+    assert values['submissions'] == 1
+    assert values['speakers'] == 1
+
+    other.delete()
+    assert 'submissions' not in counters(event)
+    assert 'speakers' not in counters(event)
+    assert counters(event) == {name: value for name, value in EventCounter.compute(event).items() if value}
+
+
+@pytest.mark.django_db
+def test_recount_command(event, submission):
+    EventCounter.objects.all().delete()
+    call_command('recount_event_counters')
+    assert counters(event)['submissions'] == 1
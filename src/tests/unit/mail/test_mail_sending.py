@@ -0,0 +1,106 @@
+import pytest
+from django.core import mail as djmail
+
+from pretalx.common.mail import send_queued_mails_task
+from pretalx.mail.models import QueuedMail
+
+
+@pytest.fixture
+def queued_mails(event):
+    return [
+        QueuedMail.objects.create(
+            event=event, to=f'speaker{index}@example.org', reply_to='orga@org.org',
+            subject=f'Mail {index}', text='Hello!',
+        )
+        for index in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_send_queued_mails_in_chunks(event, queued_mails, monkeypatch):
+    from django.core.mail.backends.locmem import EmailBackend
+    opened = []
+    monkeypatch.setattr(EmailBackend, 'open', lambda self: opened.append(self), raising=False)
+
+    assert send_queued_mails_task([mail.pk for mail in queued_mails], chunk_size=2) == 5
+    assert len(djmail.outbox) == 5
+    assert djmail.outbox[0].to == ['speaker0@example.org']
+    assert djmail.outbox[0].from_email == 'orga@org.org'
+    assert len(opened) == 3
+    assert not QueuedMail.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_queued_mails_records_failures(event, queued_mails, monkeypatch):
+    from django.core.mail.backends.locmem import EmailBackend
+    original = EmailBackend.send_messages
+
+    def send_messages(self, messages):
+        if messages[0].to == ['speaker2@example.org']:
+            raise Exception('Recipient refused')
+        return original(self, messages)
+
+    monkeypatch.setattr(EmailBackend, 'send_messages', send_messages)
+    assert send_queued_mails_task([mail.pk for mail in queued_mails]) == 4
+    assert len(djmail.outbox) == 4
+    failed = QueuedMail.objects.get()
+    assert failed.to == 'speaker2@example.org'
+    assert failed.error == 'Recipient refused'
+
+
+@pytest.mark.django_db
+def test_send_queued_mails_records_connection_failures(event, queued_mails, monkeypatch):
+    from django.core.mail.backends.locmem import EmailBackend
+    opened = []
+
+    def open_connection(self):
+        opened.append(self)
+        if len(opened) == 2:
+            raise Exception('Connection refused')
+
+    monkeypatch.setattr(EmailBackend, 'open', open_connection, raising=False)
+    assert send_queued_mails_task([mail.pk for mail in queued_mails], chunk_size=2) == 3
+    assert len(djmail.outbox) == 3
+    failed = QueuedMail.objects.order_by('pk')
+    assert [mail.to for mail in failed] == ['speaker2@example.org', 'speaker3@example.org']
+    assert {mail.error for mail in failed} == {'Connection refused'}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_send_queued_mails_logs_sent_mails(event, queued_mails):
+    from pretalx.common.models import ActivityLog
+    from pretalx.person.models import User
+    orga_user = User.objects.create_user('orga', 'orgapassw0rd', email='orga@example.org')
+    send_queued_mails_task([mail.pk for mail in queued_mails[:2]], person=orga_user.pk)
+    logs = ActivityLog.objects.filter(action_type='pretalx.mail.sent')
+    assert sorted(logs.values_list('object_id', flat=True)) == sorted(mail.pk for mail in queued_mails[:2])
+    assert {log.person for log in logs} == {orga_user}
+
+
+@pytest.mark.django_db
+def test_send_queued_mails_records_failed_reconnect(event, queued_mails, monkeypatch):
+    from django.core.mail.backends.locmem import EmailBackend
+    original = EmailBackend.send_messages
+    opened = []
+
+    def open_connection(self):
+        opened.append(self)
+        if len(opened) > 1:
+            raise Exception('Connection refused')
+
+    def send_messages(self, messages):
+        if messages[0].to == ['speaker1@example.org']:
+            raise Exception('Recipient refused')
+        return original(self, messages)
+
+    monkeypatch.setattr(EmailBackend, 'open', open_connection, raising=False)
+    monkeypatch.setattr(EmailBackend, 'send_messages', send_messages)
+    assert send_queued_mails_task([mail.pk for mail in queued_mails], chunk_size=3) == 1
+    assert [mail.to for mail in djmail.outbox] == [['speaker0@example.org']]
+    errors = dict(QueuedMail.objects.values_list('to', 'error'))
+    assert errors == {
+        'speaker1@example.org': 'Recipient refused',
+        'speaker2@example.org': 'Connection refused',
+        'speaker3@example.org': 'Connection refused',
+        'speaker4@example.org': 'Connection refused',
+    }
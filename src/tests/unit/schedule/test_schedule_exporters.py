@@ -0,0 +1,64 @@
+import datetime
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from django.core.files.storage import default_storage
+from django.utils.timezone import now
+
+from pretalx.schedule.exporters import (
+    FrabXmlExporter, ICalExporter, JSONExporter,
+)
+from pretalx.schedule.tasks import export_schedule
+
+
+@pytest.fixture
+def released_schedule(talk_slot):
+    talk_slot.start = now()
+    talk_slot.end = talk_slot.start + datetime.timedelta(minutes=45)
+    talk_slot.save()
+    schedule, _ = talk_slot.schedule.freeze('v1')
+    return schedule
+
+
+@pytest.mark.django_db
+def test_json_export(released_schedule):
+    content = json.loads(JSONExporter(released_schedule).render())
+    assert content['schedule']['version'] == 'v1'
+    assert content['schedule']['talks'][0]['title'] == 'Submission'
+    assert content['schedule']['talks'][0]['speakers'] == ['Speaker']
+
+
+@pytest.mark.django_db
+def test_frab_xml_export(released_schedule):
+    root = ET.fromstring(FrabXmlExporter(released_schedule).render().split('\n', 1)[1])
+    assert root.find('version').text == 'v1'
+    talk = root.find('day/room/event')
+    assert talk.find('title').text == 'Submission'
+    assert talk.find('duration').text == '00:45'
+    assert talk.find('persons/person').text == 'Speaker'
+
+
+@pytest.mark.django_db
+def test_ical_export(released_schedule):
+    content = ICalExporter(released_schedule).render()
+    assert content.startswith('BEGIN:VCALENDAR\r\n')
+    assert 'SUMMARY:Submission\r\n' in content
+    assert all(len(line.encode()) <= 75 for line in content.split('\r\n'))
+
+
+@pytest.mark.django_db
+def test_export_task_stores_files(released_schedule):
+    export_schedule(released_schedule.pk)
+    for exporter in (JSONExporter, FrabXmlExporter, ICalExporter):
+        assert default_storage.exists(exporter(released_schedule).path)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('exporter', (JSONExporter, FrabXmlExporter, ICalExporter))
+def test_export_skips_slots_without_end(talk_slot, exporter):
+    talk_slot.start = now()
+    talk_slot.end = None
+    talk_slot.save()
+    schedule, _ = talk_slot.schedule.freeze('v1')
+    assert 'Submission' not in exporter(schedule).render()
@@ -1,8 +1,11 @@
 import datetime
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from pretalx.schedule.models import Schedule, TalkSlot
+from pretalx.submission.models import Submission
 
 
 @pytest.mark.django_db
@@ -42,3 +45,30 @@ def test_scheduled_talks(talk_slot, room):
     talk_slot.start = datetime.datetime.now()
     talk_slot.save()
     assert talk_slot.schedule.scheduled_talks.count() == 1
+
+
+@pytest.mark.django_db
+def test_revision_bumped_on_slot_save(talk_slot):
+    schedule = talk_slot.schedule
+    revision = schedule.revision
+    talk_slot.start = datetime.datetime.now()
+    talk_slot.save()
+    schedule.refresh_from_db()
+    assert schedule.revision == talk_slot.revision
+    assert schedule.revision > revision
+
+
+@pytest.mark.django_db
+def test_freeze_query_count_is_constant(event, talk_slot, django_assert_num_queries):
+    with CaptureQueriesContext(connection) as small_freeze:
+        _, schedule = talk_slot.schedule.freeze('Small')
+
+    for index in range(10):
+        submission = Submission.objects.create(
+            title=f'Submission {index}', event=event, submission_type=event.cfp.default_type,
+        )
+        TalkSlot.objects.create(submission=submission, room=talk_slot.room, schedule=schedule)
+
+    with django_assert_num_queries(len(small_freeze.captured_queries)):
+        _, new_schedule = schedule.freeze('Big')
+    assert new_schedule.talks.count() == 11
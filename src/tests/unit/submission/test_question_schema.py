@@ -0,0 +1,90 @@
+import pytest
+
+from pretalx.cfp.forms.submissions import QuestionsForm
+from pretalx.event.models import Event
+from pretalx.submission.cache import get_question_schema
+from pretalx.submission.models import (
+    Answer, AnswerOption, Question, QuestionVariant,
+)
+
+
+@pytest.fixture
+def choice_question(event):
+    question = Question.objects.create(event=event, question='Track?', variant=QuestionVariant.CHOICES)
+    AnswerOption.objects.create(question=question, answer='Web')
+    AnswerOption.objects.create(question=question, answer='Hardware')
+    return question
+
+
+@pytest.mark.django_db
+def test_question_schema_is_cached(event, choice_question, locmem_cache, django_assert_num_queries):
+    assert get_question_schema(event) == [choice_question]
+    with django_assert_num_queries(0):
+        questions = get_question_schema(event)
+        assert [str(option) for option in questions[0].options.all()] == ['Web', 'Hardware']
+
+
+@pytest.mark.django_db
+def test_question_schema_invalidated_on_question_change(event, choice_question, locmem_cache):
+    get_question_schema(event)
+    choice_question.question = 'Which track?'
+    choice_question.save()
+    assert str(get_question_schema(event)[0].question) == 'Which track?'
+    other = Question.objects.create(event=event, question='Age?', variant=QuestionVariant.NUMBER, position=1)
+    assert get_question_schema(event) == [choice_question, other]
+    other.delete()
+    assert get_question_schema(event) == [choice_question]
+
+
+@pytest.mark.django_db
+def test_question_schema_invalidated_on_option_change(event, choice_question, locmem_cache):
+    get_question_schema(event)
+    AnswerOption.objects.create(question=choice_question, answer='Art')
+    assert len(get_question_schema(event)[0].options.all()) == 3
+    choice_question.options.get(answer='Art').delete()
+    assert len(get_question_schema(event)[0].options.all()) == 2
+
+
+@pytest.mark.django_db
+def test_questions_form_renders_without_queries(event, choice_question, locmem_cache, django_assert_num_queries):
+    Question.objects.create(event=event, question='Age?', variant=QuestionVariant.NUMBER)
+    get_question_schema(event)
+    fresh_event = Event.objects.get(pk=event.pk)
+    with django_assert_num_queries(0):
+        form = QuestionsForm(event=fresh_event)
+        assert len(form.fields) == 2
+        str(form)
+
+
+@pytest.mark.django_db
+def test_questions_form_uses_answers_as_initial(event, submission, choice_question):
+    hardware = choice_question.options.get(answer='Hardware')
+    answer = Answer.objects.create(question=choice_question, submission=submission, answer='Hardware')
+    answer.options.add(hardware)
+
+    form = QuestionsForm(event=event, submission=submission)
+    field = form.fields[f'question_{choice_question.pk}']
+    assert field.answer == answer
+    assert field.initial == hardware.pk
+
+
+@pytest.mark.django_db
+def test_questions_form_cleans_to_options(event, choice_question):
+    web = choice_question.options.get(answer='Web')
+    form = QuestionsForm(event=event, data={f'question_{choice_question.pk}': str(web.pk)})
+    assert form.is_valid()
+    assert form.cleaned_data[f'question_{choice_question.pk}'] == web
+
+
+@pytest.mark.django_db
+def test_questions_form_loads_answers_at_once(event, submission, choice_question, locmem_cache, django_assert_num_queries):
+    answer = Answer.objects.create(question=choice_question, submission=submission, answer='Web')
+    answer.options.add(choice_question.options.get(answer='Web'))
+    for position in range(3):
+        question = Question.objects.create(event=event, question='Age?', variant=QuestionVariant.NUMBER, position=position)
+        Answer.objects.create(question=question, submission=submission, answer='42')
+    get_question_schema(event)
+    fresh_event = Event.objects.get(pk=event.pk)
+    with django_assert_num_queries(2):
+        form = QuestionsForm(event=fresh_event, submission=submission)
+    assert form.fields[f'question_{choice_question.pk}'].initial == answer.options.get().pk
@@ -1,6 +1,8 @@
 import pytest
 
-from pretalx.submission.models import SubmissionError, SubmissionStates
+from pretalx.submission.models import (
+    Submission, SubmissionError, SubmissionStates,
+)
 
 
 @pytest.mark.parametrize('state', (
@@ -70,3 +72,25 @@ def test_reject(submission, state):
     assert submission.logged_actions().count() == (count + 1)
     assert submission.event.queued_mails.count() == 1
     assert submission.event.wip_schedule.talks.count() == 0
+
+
+@pytest.mark.django_db
+def test_submission_code_retried_on_collision(submission, monkeypatch):
+    codes = iter([submission.code, 'NEWCODE'])
+    monkeypatch.setattr(Submission, '_random_code', classmethod(lambda cls: next(codes)))
+    other = Submission.objects.create(
+        title='Other', event=submission.event, submission_type=submission.submission_type,
+    )
+    assert other.code == 'NEWCODE'
+
+
+@pytest.mark.django_db
+def test_assign_codes_in_bulk(submission, django_assert_num_queries):
+    submissions = [
+        Submission(title=f'Imported {index}', event=submission.event, submission_type=submission.submission_type)
+        for index in range(20)
+    ]
+    with django_assert_num_queries(1):
+        Submission.assign_codes(submissions)
+    Submission.objects.bulk_create(submissions)
+    assert Submission.objects.values('code').distinct().count() == 21